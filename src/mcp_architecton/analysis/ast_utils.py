@@ -1,39 +1,177 @@
 from __future__ import annotations
 
 import ast
-from typing import Any
+import re
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, TypeVar
 
-import astroid  # type: ignore
+_N = TypeVar("_N", bound=ast.AST)
+_R = TypeVar("_R")
 
+# Same line splitting as the parser (and ast.get_source_segment): \r\n, \r or \n, never \f
+_LINE_RE = re.compile(r"[^\r\n]*(?:\r\n|\r|\n)|[^\r\n]+\Z")
 
-def analyze_code_for_patterns(source: str, registry: dict[str, Any]) -> list[dict[str, Any]]:
-    """Run all registered detectors against the source and collect findings."""
+
+@lru_cache(maxsize=8)
+def _source_lines(source: str) -> tuple[str, ...]:
+    return tuple(_LINE_RE.findall(source))
+
+
+def get_source_segment(source: str, node: ast.AST) -> str | None:
+    """Drop-in for ``ast.get_source_segment`` that splits ``source`` once per text.
+
+    The stdlib version re-splits the whole source character by character on every
+    call, which turns detectors that inspect each method into O(lines^2) per file.
+    """
     try:
-        tree = ast.parse(source)
-    except SyntaxError as exc:
-        return [{"name": "ParseError", "confidence": 0.0, "reason": str(exc)}]
+        end_lineno = node.end_lineno  # type: ignore[attr-defined]
+        end_col_offset = node.end_col_offset  # type: ignore[attr-defined]
+        if end_lineno is None or end_col_offset is None:
+            return None
+        lineno = node.lineno - 1  # type: ignore[attr-defined]
+        end_lineno -= 1
+        col_offset = node.col_offset  # type: ignore[attr-defined]
+    except AttributeError:
+        return None
 
-    # Best-effort: parse using astroid for richer inference; detectors still receive stdlib AST
-    # Warm astroid to ensure consistent behavior (ignore errors)
-    try:  # pragma: no cover - optional
-        astroid.parse(source)  # type: ignore[attr-defined]
-    except Exception:
-        pass
+    lines = _source_lines(source)
+    if end_lineno == lineno:
+        return lines[lineno].encode()[col_offset:end_col_offset].decode()
 
-    findings: list[dict[str, Any]] = []
-    for name, detector in registry.items():
+    first = lines[lineno].encode()[col_offset:].decode()
+    last = lines[end_lineno].encode()[:end_col_offset].decode()
+    return "".join((first, *lines[lineno + 1 : end_lineno], last))
+
+
+# Per-call memo of derived node data (see analysis_scope). Keyed on the node objects, so
+# entries pin their trees only until the scope that owns them exits.
+_scope_memo: ContextVar[dict[tuple[str, ast.AST], Any] | None] = ContextVar(
+    "_scope_memo",
+    default=None,
+)
+
+
+@contextmanager
+def analysis_scope() -> Iterator[None]:
+    """Share walks and class prefixes between detectors for the duration of one analysis.
+
+    Outside a scope the helpers below compute their result afresh on every call; nested
+    scopes reuse the outermost memo. Nothing is retained once the outermost scope exits.
+    """
+    if _scope_memo.get() is not None:
+        yield
+        return
+    token = _scope_memo.set({})
+    try:
+        yield
+    finally:
+        _scope_memo.reset(token)
+
+
+def _scoped(kind: str, node: _N, compute: Callable[[_N], _R]) -> _R:
+    memo = _scope_memo.get()
+    if memo is None:
+        return compute(node)
+    key = (kind, node)
+    if key not in memo:
+        memo[key] = compute(node)
+    return memo[key]
+
+
+def _build_walk_index(node: ast.AST) -> dict[type[ast.AST], tuple[ast.AST, ...]]:
+    # Breadth-first like ast.walk, but reading _fields directly instead of going through
+    # the iter_child_nodes/iter_fields generators, which dominate ast.walk's cost
+    grouped: defaultdict[type[ast.AST], list[ast.AST]] = defaultdict(list)
+    queue: list[ast.AST] = [node]
+    for n in queue:  # the queue grows while it is consumed
+        grouped[type(n)].append(n)
+        for field in n._fields:
+            value = getattr(n, field, None)
+            if isinstance(value, ast.AST):
+                queue.append(value)
+            elif isinstance(value, list):
+                queue.extend(c for c in value if isinstance(c, ast.AST))
+    return {t: tuple(ns) for t, ns in grouped.items()}
+
+
+def _walk_index(node: ast.AST) -> dict[type[ast.AST], tuple[ast.AST, ...]]:
+    return _scoped("walk", node, _build_walk_index)
+
+
+def walk_nodes(node: ast.AST, *node_types: type[_N]) -> tuple[_N, ...]:
+    """Nodes of the given concrete types within ``node`` (inclusive), in ``ast.walk`` order.
+
+    Within an ``analysis_scope`` each subtree is walked once and grouped by node type, so
+    detectors that inspect the same method (Facade, Strategy, Template Method, ...) share
+    one walk. With several types, nodes are grouped per type rather than interleaved.
+    """
+    index = _walk_index(node)
+    if len(node_types) == 1:
+        return index.get(node_types[0], ())  # type: ignore[return-value]
+    return tuple(n for t in node_types for n in index.get(t, ()))  # type: ignore[misc]
+
+
+def top_level_classes(tree: ast.AST) -> tuple[ast.ClassDef, ...]:
+    """Classes defined directly in the module body.
+
+    Most class-shaped detectors start from this same prefix; within an ``analysis_scope``
+    it is collected once per tree and shared between them.
+    """
+    return _scoped(
+        "classes",
+        tree,
+        lambda t: tuple(n for n in getattr(t, "body", []) if isinstance(n, ast.ClassDef)),
+    )
+
+
+def class_methods(cls: ast.ClassDef) -> tuple[ast.FunctionDef, ...]:
+    """Plain (non-async) methods defined directly in ``cls``, in body order."""
+    return _scoped(
+        "methods",
+        cls,
+        lambda c: tuple(m for m in c.body if isinstance(m, ast.FunctionDef)),
+    )
+
+
+def method_names(cls: ast.ClassDef) -> frozenset[str]:
+    """Names of the plain methods defined directly in ``cls``."""
+    return _scoped("method_names", cls, lambda c: frozenset(m.name for m in class_methods(c)))
+
+
+def analyze_code_for_patterns(
+    source: str,
+    registry: dict[str, Any],
+    tree: ast.Module | None = None,
+) -> list[dict[str, Any]]:
+    """Run all registered detectors against the source and collect findings.
+
+    Callers that already parsed ``source`` can pass the module as ``tree`` to skip re-parsing.
+    """
+    if tree is None:
         try:
-            res = detector(tree, source)
-            if res:
-                findings.extend(res)
-        except (AttributeError, TypeError, ValueError) as exc:
-            findings.append(
-                {
-                    "name": name,
-                    "confidence": 0.0,
-                    "reason": f"detector-error: {exc}",
-                },
-            )
+            tree = ast.parse(source)
+        except SyntaxError as exc:
+            return [{"name": "ParseError", "confidence": 0.0, "reason": str(exc)}]
+
+    findings: list[dict[str, Any]] = []
+    with analysis_scope():
+        for name, detector in registry.items():
+            try:
+                res = detector(tree, source)
+                if res:
+                    findings.extend(res)
+            except (AttributeError, TypeError, ValueError) as exc:
+                findings.append(
+                    {
+                        "name": name,
+                        "confidence": 0.0,
+                        "reason": f"detector-error: {exc}",
+                    },
+                )
     return findings
 
 
@@ -44,6 +182,8 @@ def astroid_summary(source: str) -> dict[str, Any]:
     Purely optional helper. Does not affect detectors.
     """
     try:  # pragma: no cover - optional
+        import astroid  # type: ignore
+
         mod: Any = astroid.parse(source)  # type: ignore[attr-defined]
         try:
             body: list[Any] = list(mod.body)  # type: ignore[attr-defined]
@@ -60,4 +200,13 @@ def astroid_summary(source: str) -> dict[str, Any]:
         return {"error": str(exc)}
 
 
-__all__ = ["analyze_code_for_patterns", "astroid_summary"]
+__all__ = [
+    "analysis_scope",
+    "analyze_code_for_patterns",
+    "astroid_summary",
+    "class_methods",
+    "get_source_segment",
+    "method_names",
+    "top_level_classes",
+    "walk_nodes",
+]
@@ -6,6 +6,7 @@ with baseline weights in addition to curated boosts.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any
 
 # Richer tokenization using tree-sitter (declared in pyproject)
@@ -58,7 +59,7 @@ def _tokenize_lower(text: str) -> str:
 def _canonical_from_text(
     token_text: str,
     advice_keys: list[str],
-    aliases: dict[str, str],
+    aliases: Mapping[str, str],
 ) -> set[str]:
     """Find advice keys referenced in free-form text using direct and alias-based matching."""
     text = token_text.lower()
@@ -84,7 +85,7 @@ def ranked_enforcement_targets(
     recs: list[str],
     pattern_advice: dict[str, str],
     arch_advice: dict[str, str],
-    name_aliases: dict[str, str],
+    name_aliases: Mapping[str, str],
 ) -> list[tuple[str, str, int, list[str]]]:
     """Return list of (name, category, weight, reasons) sorted by weight.
 
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:  # optional: faster JSON decoding for catalogs, caches and linter output
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def loads(data: str | bytes) -> Any:
+    """Decode JSON from text or raw bytes, using orjson when it is installed.
+
+    Both decoders raise ``ValueError`` subclasses on malformed input.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+__all__ = ["loads"]
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 import libcst as cst
 from libcst import parse_module
 from libcst.codemod import CodemodContext
 from libcst.codemod.visitors import AddImportsVisitor
 
+# LibCST nodes are immutable, so one annotation node can be shared by every insertion
+_ANY_ANNOTATION = cst.Annotation(cst.Name("Any"))
+
 
 class _AddTypeHints(cst.CSTTransformer):
     """Annotate untyped function params and returns with `Any`.
@@ -20,7 +25,7 @@ class _AddTypeHints(cst.CSTTransformer):
     def leave_Param(self, original_node: cst.Param, updated_node: cst.Param) -> cst.Param:  # noqa: N802
         if updated_node.annotation is None and updated_node.name.value not in {"self", "cls"}:
             self.changed = True
-            return updated_node.with_changes(annotation=cst.Annotation(cst.Name("Any")))
+            return updated_node.with_changes(annotation=_ANY_ANNOTATION)
         return updated_node
 
     def leave_FunctionDef(  # noqa: N802
@@ -30,15 +35,46 @@ class _AddTypeHints(cst.CSTTransformer):
     ) -> cst.FunctionDef:
         if updated_node.returns is None and updated_node.name.value != "__init__":
             self.changed = True
-            return updated_node.with_changes(returns=cst.Annotation(cst.Name("Any")))
+            return updated_node.with_changes(returns=_ANY_ANNOTATION)
         return updated_node
 
 
+def _imports_typing_any(mod: cst.Module) -> bool:
+    """True when a top-level ``from typing import Any`` (unaliased) is already present."""
+    for stmt in mod.body:
+        if not isinstance(stmt, cst.SimpleStatementLine):
+            continue
+        for small in stmt.body:
+            if (
+                isinstance(small, cst.ImportFrom)
+                and not small.relative
+                and isinstance(small.module, cst.Name)
+                and small.module.value == "typing"
+                and not isinstance(small.names, cst.ImportStar)
+                and any(
+                    a.asname is None and isinstance(a.name, cst.Name) and a.name.value == "Any"
+                    for a in small.names
+                )
+            ):
+                return True
+    return False
+
+
+# Each entry pins a whole source file and its rewrite, so only a handful are kept
+_HINTS_CACHE_MAX = 16
+
+
+@lru_cache(maxsize=_HINTS_CACHE_MAX)
 def add_type_hints_to_code(source: str) -> tuple[bool, str]:
     """Return (changed, code) with Any annotations added where missing.
 
     Preserves formatting and comments. Adds `from typing import Any` when changes occur.
+    The last few results are memoized per source text, so an immediate repeat request
+    skips the LibCST passes.
     """
+    # Only functions and lambdas carry params or returns to annotate; skip the parse
+    if "def" not in source and "lambda" not in source:
+        return (False, source)
     try:
         mod = parse_module(source)
     except Exception:
@@ -49,7 +85,9 @@ def add_type_hints_to_code(source: str) -> tuple[bool, str]:
     if not transformer.changed:
         return (False, source)
 
-    # Ensure `Any` import is present
+    # Ensure `Any` import is present; skip the extra full-tree pass when it already is
+    if _imports_typing_any(new_mod):
+        return (True, new_mod.code)
     ctx = CodemodContext()
     AddImportsVisitor.add_needed_import(ctx, "typing", "Any")
     new_mod2 = AddImportsVisitor(ctx).transform_module(new_mod)
@@ -3,6 +3,8 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import get_source_segment
+
 
 def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     """Detect CQRS (Command Query Responsibility Segregation).
@@ -32,14 +34,14 @@ def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
             name = node.name.lower()
             if "command" in name:
                 has_command_handler = True
-                src_fn = ast.get_source_segment(source, node) or ""
+                src_fn = get_source_segment(source, node) or ""
                 if ("uow" in src_fn and ".add(" in src_fn) or (
                     "repo" in src_fn and ".add(" in src_fn
                 ):
                     mutates_state = True
             if "query" in name:
                 has_query_handler = True
-                src_fn = ast.get_source_segment(source, node) or ""
+                src_fn = get_source_segment(source, node) or ""
                 if ("view." in src_fn and ".get_" in src_fn) or (
                     "return" in src_fn and "get_" in src_fn
                 ):
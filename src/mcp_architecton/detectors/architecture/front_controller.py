@@ -3,6 +3,8 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import class_methods, get_source_segment
+
 
 def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     """Detect Front Controller.
@@ -28,15 +30,15 @@ def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
                             route_map_name = node.targets[0].id
         elif isinstance(node, ast.ClassDef):
             # detect instance route maps set in __init__
-            for m in node.body:
-                if isinstance(m, ast.FunctionDef) and m.name == "__init__":
-                    src = ast.get_source_segment(source, m) or ""
+            for m in class_methods(node):
+                if m.name == "__init__":
+                    src = get_source_segment(source, m) or ""
                     if "self.routes" in src and "{" in src and "}" in src:
                         has_route_map = True
 
     def is_dispatch(fn: ast.FunctionDef) -> bool:
         if fn.name in {"handle", "dispatch", "route", "process_request"}:
-            src = ast.get_source_segment(source, fn) or ""
+            src = get_source_segment(source, fn) or ""
             if (route_map_name and route_map_name in src) or ".routes" in src or ".get(" in src:
                 return True
         return False
@@ -46,8 +48,8 @@ def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
         if isinstance(node, ast.FunctionDef) and is_dispatch(node):
             dispatchers += 1
         elif isinstance(node, ast.ClassDef):
-            for m in node.body:
-                if isinstance(m, ast.FunctionDef) and is_dispatch(m):
+            for m in class_methods(node):
+                if is_dispatch(m):
                     dispatchers += 1
 
     if has_route_map and dispatchers:
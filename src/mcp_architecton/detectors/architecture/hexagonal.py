@@ -3,6 +3,8 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import walk_nodes
+
 PORT_HINTS = {"Protocol", "ABC", "abstractmethod"}
 ADAPTER_HINTS = {"Adapter", "Repository", "Gateway"}
 
@@ -54,15 +56,14 @@ def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
                 # count calls to imported modules inside methods
                 for m in node.body:
                     if isinstance(m, ast.FunctionDef):
-                        for sub in ast.walk(m):
-                            if isinstance(sub, ast.Call):
-                                func = sub.func
-                                if isinstance(func, ast.Attribute) and isinstance(
-                                    func.value,
-                                    ast.Name,
-                                ):
-                                    if func.value.id in imported_modules:
-                                        external_calls += 1
+                        for sub in walk_nodes(m, ast.Call):
+                            func = sub.func
+                            if isinstance(func, ast.Attribute) and isinstance(
+                                func.value,
+                                ast.Name,
+                            ):
+                                if func.value.id in imported_modules:
+                                    external_calls += 1
 
     score = 0
     score += 1 if ports else 0
@@ -3,6 +3,8 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import get_source_segment
+
 LAYER_NAMES = {
     "presentation",
     "ui",
@@ -44,13 +46,13 @@ def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
             if role == "Controller":
                 for m in node.body:
                     if isinstance(m, ast.FunctionDef):
-                        msrc = ast.get_source_segment(source, m) or ""
+                        msrc = get_source_segment(source, m) or ""
                         if ".Service(" in msrc or ".service" in msrc or "self.service." in msrc:
                             wiring += 1
             if role == "Service":
                 for m in node.body:
                     if isinstance(m, ast.FunctionDef):
-                        msrc = ast.get_source_segment(source, m) or ""
+                        msrc = get_source_segment(source, m) or ""
                         if (
                             ".Repository(" in msrc
                             or ".repository" in msrc
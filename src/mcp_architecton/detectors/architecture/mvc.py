@@ -3,6 +3,8 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import get_source_segment
+
 MODEL_HINTS = {"Model", "Entity"}
 VIEW_HINTS = {"View", "Template", "Renderer"}
 CONTROLLER_HINTS = {"Controller", "Presenter"}
@@ -27,7 +29,7 @@ def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
         if isinstance(node, ast.ClassDef) and roles.get(node.name) == "Controller":
             for m in node.body:
                 if isinstance(m, ast.FunctionDef):
-                    src = ast.get_source_segment(source, m) or ""
+                    src = get_source_segment(source, m) or ""
                     # Controller uses model and passes to view
                     uses_model = "Model(" in src or "self.model" in src
                     uses_view = "View(" in src or "self.view" in src or "render(" in src
@@ -3,6 +3,8 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import get_source_segment, method_names
+
 
 def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     """Detect Repository pattern.
@@ -18,8 +20,8 @@ def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
         if isinstance(node, ast.ClassDef) and (
             node.name.endswith("Repository") or node.name.endswith("Repo")
         ):
-            src = ast.get_source_segment(source, node) or ""
-            methods = {m.name for m in node.body if isinstance(m, ast.FunctionDef)}
+            src = get_source_segment(source, node) or ""
+            methods = method_names(node)
             has_crud = {"add", "get", "list"} & methods
             uses_session = any(s in src for s in ["session", "db", "collection"])
             if has_crud and uses_session:
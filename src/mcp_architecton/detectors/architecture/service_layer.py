@@ -3,6 +3,8 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import get_source_segment, walk_nodes
+
 
 def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     """Detect Service Layer pattern.
@@ -23,20 +25,17 @@ def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
         has_uow_param = any(a.arg == "uow" for a in fn.args.args)
         if not has_uow_param:
             return False
-        src_fn = ast.get_source_segment(source, fn) or ""
+        src_fn = get_source_segment(source, fn) or ""
         if "with uow" in src_fn and ".commit(" in src_fn:
             return True
         # AST pass: look for With using Name 'uow'
-        for stmt in ast.walk(fn):
-            if isinstance(stmt, ast.With):
-                for item in stmt.items:
-                    if isinstance(item.context_expr, ast.Name) and item.context_expr.id == "uow":
-                        # look for commit call inside
-                        body_src = "\n".join(
-                            (ast.get_source_segment(source, b) or "") for b in stmt.body
-                        )
-                        if ".commit(" in body_src:
-                            return True
+        for stmt in walk_nodes(fn, ast.With):
+            for item in stmt.items:
+                if isinstance(item.context_expr, ast.Name) and item.context_expr.id == "uow":
+                    # look for commit call inside
+                    body_src = "\n".join((get_source_segment(source, b) or "") for b in stmt.body)
+                    if ".commit(" in body_src:
+                        return True
         return False
 
     # direct name + mentions
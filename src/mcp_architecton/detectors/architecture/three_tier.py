@@ -3,6 +3,8 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import get_source_segment
+
 TIERS = {"Controller", "Service", "Repository"}
 
 
@@ -24,7 +26,7 @@ def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
             continue
         for m in cls.body:
             if isinstance(m, ast.FunctionDef):
-                src = ast.get_source_segment(source, m) or ""
+                src = get_source_segment(source, m) or ""
                 if role == "Controller" and (
                     "Service(" in src or ".service" in src or "self.service." in src
                 ):
@@ -3,6 +3,8 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import get_source_segment, method_names
+
 
 def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     """Detect Unit of Work pattern.
@@ -17,10 +19,10 @@ def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
         if isinstance(node, ast.ClassDef) and (
             node.name.lower() == "unitofwork" or node.name.lower().endswith("uow")
         ):
-            methods = {m.name for m in node.body if isinstance(m, ast.FunctionDef)}
+            methods = method_names(node)
             cm_ok = "__enter__" in methods and "__exit__" in methods
             tx_ok = {"begin", "commit", "rollback"} & methods
-            src = ast.get_source_segment(source, node) or ""
+            src = get_source_segment(source, node) or ""
             manages_session = any(s in src for s in ["session", "engine", "connection"])
             if cm_ok and manages_session and tx_ok:
                 findings.append(
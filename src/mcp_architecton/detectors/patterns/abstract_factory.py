@@ -3,6 +3,8 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import class_methods, get_source_segment, top_level_classes
+
 
 def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     """Detect Abstract Factory by multiple create_* methods constructing different products."""
@@ -10,11 +12,11 @@ def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
 
     module_classes = {n.name for n in getattr(tree, "body", []) if isinstance(n, ast.ClassDef)}
 
-    for cls in [n for n in getattr(tree, "body", []) if isinstance(n, ast.ClassDef)]:
+    for cls in top_level_classes(tree):
         create_methods: dict[str, set[str]] = {}
-        for m in cls.body:
-            if isinstance(m, ast.FunctionDef) and m.name.startswith("create_"):
-                src = ast.get_source_segment(source, m) or ""
+        for m in class_methods(cls):
+            if m.name.startswith("create_"):
+                src = get_source_segment(source, m) or ""
                 returns: set[str] = set()
                 for name in module_classes:
                     if f"return {name}(" in src:
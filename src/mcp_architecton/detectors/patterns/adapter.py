@@ -3,6 +3,8 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import class_methods, get_source_segment, top_level_classes
+
 ALIASES = {"request", "execute", "run", "handle"}
 
 
@@ -10,11 +12,11 @@ def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     """Detect Adapter: class translating method names to adaptee's API."""
     results: list[dict[str, Any]] = []
 
-    for cls in [n for n in getattr(tree, "body", []) if isinstance(n, ast.ClassDef)]:
+    for cls in top_level_classes(tree):
         adaptee_attr: str | None = None
         # find self.<adaptee> assignment in __init__
-        for m in cls.body:
-            if isinstance(m, ast.FunctionDef) and m.name == "__init__":
+        for m in class_methods(cls):
+            if m.name == "__init__":
                 for st in m.body:
                     if isinstance(st, ast.Assign):
                         for t in st.targets:
@@ -27,9 +29,9 @@ def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
         if not adaptee_attr:
             continue
         delegate_count = 0
-        for m in cls.body:
-            if isinstance(m, ast.FunctionDef) and m.name != "__init__":
-                text = ast.get_source_segment(source, m) or ""
+        for m in class_methods(cls):
+            if m.name != "__init__":
+                text = get_source_segment(source, m) or ""
                 if f"self.{adaptee_attr}." in text:
                     delegate_count += 1
         if delegate_count >= 1:
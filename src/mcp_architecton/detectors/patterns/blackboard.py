@@ -3,6 +3,8 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import get_source_segment
+
 
 def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     """Detect Blackboard pattern (very heuristic).
@@ -22,7 +24,7 @@ def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
 
     for node in getattr(tree, "body", []):
         if isinstance(node, ast.ClassDef):
-            cls_src = ast.get_source_segment(source, node) or ""
+            cls_src = get_source_segment(source, node) or ""
             if "blackboard" in cls_src and ("={" in cls_src or "= {}" in cls_src):
                 has_blackboard = True
 
@@ -3,12 +3,14 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import get_source_segment, top_level_classes
+
 
 def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     """Detect Borg (shared state singleton) implementation."""
     findings: list[dict[str, Any]] = []
 
-    for cls in [n for n in getattr(tree, "body", []) if isinstance(n, ast.ClassDef)]:
+    for cls in top_level_classes(tree):
         has_shared = False
         assigns_dict = False
         for m in cls.body:
@@ -21,7 +23,7 @@ def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
                     }:
                         has_shared = True
             if isinstance(m, ast.FunctionDef) and m.name == "__init__":
-                text = ast.get_source_segment(source, m) or ""
+                text = get_source_segment(source, m) or ""
                 if "self.__dict__ =" in text and "shared_state" in text:
                     assigns_dict = True
         if has_shared and assigns_dict:
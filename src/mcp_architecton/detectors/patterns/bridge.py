@@ -3,6 +3,8 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import class_methods, get_source_segment, top_level_classes
+
 IMPL_NAMES = {"implementor", "impl", "driver", "backend"}
 
 
@@ -10,11 +12,11 @@ def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     """Detect Bridge: Abstraction has a reference to Implementor and delegates work."""
     results: list[dict[str, Any]] = []
 
-    for cls in [n for n in getattr(tree, "body", []) if isinstance(n, ast.ClassDef)]:
+    for cls in top_level_classes(tree):
         impl_attr = None
-        for m in cls.body:
-            if isinstance(m, ast.FunctionDef) and m.name == "__init__":
-                text = ast.get_source_segment(source, m) or ""
+        for m in class_methods(cls):
+            if m.name == "__init__":
+                text = get_source_segment(source, m) or ""
                 for name in IMPL_NAMES:
                     if f"self.{name} =" in text:
                         impl_attr = name
@@ -22,9 +24,9 @@ def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
         if not impl_attr:
             continue
         uses_impl = False
-        for m in cls.body:
-            if isinstance(m, ast.FunctionDef) and m.name != "__init__":
-                text = ast.get_source_segment(source, m) or ""
+        for m in class_methods(cls):
+            if m.name != "__init__":
+                text = get_source_segment(source, m) or ""
                 if f"self.{impl_attr}." in text:
                     uses_impl = True
                     break
@@ -3,24 +3,31 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import (
+    class_methods,
+    get_source_segment,
+    method_names,
+    top_level_classes,
+)
+
 
 def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     """Detect Builder: fluent setters and a build() method creating a product."""
     results: list[dict[str, Any]] = []
 
-    for cls in [n for n in getattr(tree, "body", []) if isinstance(n, ast.ClassDef)]:
-        has_build = any(isinstance(m, ast.FunctionDef) and m.name == "build" for m in cls.body)
+    for cls in top_level_classes(tree):
+        has_build = "build" in method_names(cls)
         returns_self = sum(
             1
             for m in cls.body
             if isinstance(m, ast.FunctionDef)
             and m.name != "__init__"
-            and "return self" in (ast.get_source_segment(source, m) or "")
+            and "return self" in (get_source_segment(source, m) or "")
         )
         creates_obj = False
-        for m in cls.body:
-            if isinstance(m, ast.FunctionDef) and m.name == "build":
-                text = ast.get_source_segment(source, m) or ""
+        for m in class_methods(cls):
+            if m.name == "build":
+                text = get_source_segment(source, m) or ""
                 if "return " in text and "(" in text and ")" in text:
                     creates_obj = True
         if has_build and (returns_self >= 1 or creates_obj):
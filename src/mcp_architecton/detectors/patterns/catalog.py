@@ -3,6 +3,8 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import get_source_segment
+
 
 def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     """Detect Catalog: general dispatcher calling specialized methods.
@@ -15,14 +17,14 @@ def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
 
     def dispatch_via_dict(fn: ast.FunctionDef) -> bool:
         # look for {...: self.<method>, ...}[key](...)
-        src = ast.get_source_segment(source, fn) or ""
+        src = get_source_segment(source, fn) or ""
         return "}[" in src and "](" in src and "self." in src and "{" in src
 
     def dispatch_via_if(fn: ast.FunctionDef) -> bool:
         if not fn.args.args:
             return False
         p0 = fn.args.args[0].arg
-        text = ast.get_source_segment(source, fn) or ""
+        text = get_source_segment(source, fn) or ""
         return f"if {p0} ==" in text or f"elif {p0} ==" in text or f"match {p0}:" in text
 
     for node in getattr(tree, "body", []):
@@ -3,6 +3,8 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import get_source_segment, top_level_classes
+
 HANDLER_NAMES = {"set_next", "next", "successor"}
 
 
@@ -10,16 +12,16 @@ def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     """Detect Chain of Responsibility: handlers linked and call next.handle."""
     results: list[dict[str, Any]] = []
 
-    for cls in [n for n in getattr(tree, "body", []) if isinstance(n, ast.ClassDef)]:
+    for cls in top_level_classes(tree):
         has_link = False
         delegates_next = False
         for m in cls.body:
             if isinstance(m, ast.FunctionDef):
                 if m.name in HANDLER_NAMES or m.name == "__init__":
-                    text = ast.get_source_segment(source, m) or ""
+                    text = get_source_segment(source, m) or ""
                     if "self.next" in text or "self.successor" in text:
                         has_link = True
-                text = ast.get_source_segment(source, m) or ""
+                text = get_source_segment(source, m) or ""
                 if ".handle(" in text and ("self.next" in text or "self.successor" in text):
                     delegates_next = True
         if has_link and delegates_next:
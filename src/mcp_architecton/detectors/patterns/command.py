@@ -3,6 +3,8 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import top_level_classes
+
 INVOKE_NAMES = {"execute", "run", "invoke", "do"}
 
 
@@ -10,7 +12,7 @@ def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     """Detect Command: a class encapsulating an action via execute/run."""
     results: list[dict[str, Any]] = []
 
-    for cls in [n for n in getattr(tree, "body", []) if isinstance(n, ast.ClassDef)]:
+    for cls in top_level_classes(tree):
         methods = {m.name for m in cls.body if isinstance(m, ast.FunctionDef)}
         if methods & INVOKE_NAMES:
             results.append(
@@ -3,6 +3,13 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import (
+    class_methods,
+    get_source_segment,
+    top_level_classes,
+    walk_nodes,
+)
+
 CHILDREN = {"children", "nodes", "elements", "items"}
 
 
@@ -10,11 +17,11 @@ def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     """Detect Composite: manages a list of children and iterates to call child ops."""
     results: list[dict[str, Any]] = []
 
-    for cls in [n for n in getattr(tree, "body", []) if isinstance(n, ast.ClassDef)]:
+    for cls in top_level_classes(tree):
         has_children = None
-        for m in cls.body:
-            if isinstance(m, ast.FunctionDef) and m.name == "__init__":
-                text = ast.get_source_segment(source, m) or ""
+        for m in class_methods(cls):
+            if m.name == "__init__":
+                text = get_source_segment(source, m) or ""
                 for name in CHILDREN:
                     if f"self.{name}" in text:
                         has_children = name
@@ -22,9 +29,9 @@ def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
         if not has_children:
             continue
         iterates = False
-        for m in cls.body:
-            if isinstance(m, ast.FunctionDef) and m.name != "__init__":
-                for node in ast.walk(m):
+        for m in class_methods(cls):
+            if m.name != "__init__":
+                for node in walk_nodes(m, ast.For, ast.ListComp, ast.GeneratorExp):
                     if isinstance(node, ast.For):
                         if (
                             isinstance(node.iter, ast.Attribute)
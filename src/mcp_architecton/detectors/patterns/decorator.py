@@ -3,6 +3,8 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import class_methods, get_source_segment, top_level_classes
+
 
 def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     """Detect Decorator: a wrapper class delegating to a contained component.
@@ -12,10 +14,10 @@ def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     """
     results: list[dict[str, Any]] = []
 
-    for cls in [n for n in getattr(tree, "body", []) if isinstance(n, ast.ClassDef)]:
+    for cls in top_level_classes(tree):
         wrapped_attr: str | None = None
-        for m in cls.body:
-            if isinstance(m, ast.FunctionDef) and m.name == "__init__":
+        for m in class_methods(cls):
+            if m.name == "__init__":
                 for st in m.body:
                     if isinstance(st, ast.Assign):
                         for t in st.targets:
@@ -29,9 +31,9 @@ def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
             continue
 
         delegates = False
-        for m in cls.body:
-            if isinstance(m, ast.FunctionDef) and m.name != "__init__":
-                text = ast.get_source_segment(source, m) or ""
+        for m in class_methods(cls):
+            if m.name != "__init__":
+                text = get_source_segment(source, m) or ""
                 if f"self.{wrapped_attr}." in text:
                     delegates = True
                     break
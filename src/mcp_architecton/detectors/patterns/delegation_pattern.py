@@ -3,6 +3,8 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import class_methods, get_source_segment
+
 
 def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     """Detect Delegation Pattern.
@@ -16,9 +18,9 @@ def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     for node in getattr(tree, "body", []):
         if isinstance(node, ast.ClassDef):
             forwards: dict[str, set[str]] = {}
-            for m in node.body:
-                if isinstance(m, ast.FunctionDef) and m.name != "__init__":
-                    src = ast.get_source_segment(source, m) or ""
+            for m in class_methods(node):
+                if m.name != "__init__":
+                    src = get_source_segment(source, m) or ""
                     # naive parse: look for self.<x>.
                     for token in {t for t in src.split() if t.startswith("self.") and "." in t}:
                         if token.count(".") >= 2:  # self.attr.method
@@ -3,6 +3,8 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import get_source_segment, walk_nodes
+
 
 def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     """Detect Dependency Injection.
@@ -33,24 +35,23 @@ def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
                         for arg in m.args.args[1:]:
                             init_params.add(arg.arg)
                         # Find self.<attr> = <param>
-                        for stmt in ast.walk(m):
-                            if isinstance(stmt, ast.Assign):
-                                for tgt in stmt.targets:
+                        for stmt in walk_nodes(m, ast.Assign):
+                            for tgt in stmt.targets:
+                                if (
+                                    isinstance(tgt, ast.Attribute)
+                                    and isinstance(tgt.value, ast.Name)
+                                    and tgt.value.id == "self"
+                                ):
                                     if (
-                                        isinstance(tgt, ast.Attribute)
-                                        and isinstance(tgt.value, ast.Name)
-                                        and tgt.value.id == "self"
+                                        isinstance(stmt.value, ast.Name)
+                                        and stmt.value.id in init_params
                                     ):
-                                        if (
-                                            isinstance(stmt.value, ast.Name)
-                                            and stmt.value.id in init_params
-                                        ):
-                                            injected_attrs.add(tgt.attr)
+                                        injected_attrs.add(tgt.attr)
             # Check other methods using injected attrs
             for m in methods:
                 if m.name == "__init__":
                     continue
-                src_m = ast.get_source_segment(source, m) or ""
+                src_m = get_source_segment(source, m) or ""
                 for attr in injected_attrs:
                     if f"self.{attr}." in src_m or f"self.{attr}(" in src_m:
                         used_elsewhere = True
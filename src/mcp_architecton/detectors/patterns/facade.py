@@ -3,6 +3,8 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import class_methods, walk_nodes
+
 
 def _calls_multiple_constructors_or_functions(node: ast.AST, source: str) -> bool:
     """Return True if body constructs/calls 2+ distinct names or functions.
@@ -10,13 +12,12 @@ def _calls_multiple_constructors_or_functions(node: ast.AST, source: str) -> boo
     Very lightweight: count distinct Name() constructor calls and function calls.
     """
     names: set[str] = set()
-    for n in ast.walk(node):
-        if isinstance(n, ast.Call):
-            if isinstance(n.func, ast.Name):
-                names.add(n.func.id)
-            elif isinstance(n.func, ast.Attribute) and isinstance(n.func.value, ast.Name):
-                # allow SubA().a() pattern: count SubA constructor call separately
-                pass
+    for n in walk_nodes(node, ast.Call):
+        if isinstance(n.func, ast.Name):
+            names.add(n.func.id)
+        elif isinstance(n.func, ast.Attribute) and isinstance(n.func.value, ast.Name):
+            # allow SubA().a() pattern: count SubA constructor call separately
+            pass
     return len(names) >= 2
 
 
@@ -31,8 +32,8 @@ def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
 
     for node in getattr(tree, "body", []):
         if isinstance(node, ast.ClassDef):
-            for m in node.body:
-                if isinstance(m, ast.FunctionDef) and not m.name.startswith("_"):
+            for m in class_methods(node):
+                if not m.name.startswith("_"):
                     if _calls_multiple_constructors_or_functions(m, source):
                         results.append(
                             {
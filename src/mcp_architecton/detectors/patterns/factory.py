@@ -3,6 +3,8 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import get_source_segment
+
 
 def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     """Detect simple Factory functions (alias of Factory Method heuristics)."""
@@ -11,7 +13,7 @@ def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     class_names = {n.name for n in getattr(tree, "body", []) if isinstance(n, ast.ClassDef)}
 
     def returns_known_class(fn: ast.FunctionDef) -> bool:
-        src = ast.get_source_segment(source, fn) or ""
+        src = get_source_segment(source, fn) or ""
         return any(f"{cn}(" in src for cn in class_names)
 
     for node in getattr(tree, "body", []):
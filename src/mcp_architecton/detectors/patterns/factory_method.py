@@ -3,6 +3,8 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import walk_nodes
+
 
 def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     """Detect Factory Method: function selecting and returning different classes.
@@ -15,8 +17,8 @@ def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     for node in getattr(tree, "body", []):
         if isinstance(node, ast.FunctionDef):
             returned_classes: set[str] = set()
-            for n in ast.walk(node):
-                if isinstance(n, ast.Return) and isinstance(n.value, ast.Call):
+            for n in walk_nodes(node, ast.Return):
+                if isinstance(n.value, ast.Call):
                     func = n.value.func
                     if isinstance(func, ast.Name):
                         returned_classes.add(func.id)
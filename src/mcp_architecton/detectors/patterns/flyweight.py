@@ -3,6 +3,8 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import get_source_segment
+
 
 def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     """Detect Flyweight: module-level cache reused in a factory function.
@@ -26,7 +28,7 @@ def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
 
     for node in getattr(tree, "body", []):
         if isinstance(node, ast.FunctionDef):
-            src = ast.get_source_segment(source, node) or ""
+            src = get_source_segment(source, node) or ""
             if any(name in src for name in dict_names) and (
                 " in " in src and "[" in src and "]" in src and "return " in src
             ):
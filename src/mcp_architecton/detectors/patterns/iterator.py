@@ -3,12 +3,14 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import method_names, top_level_classes
+
 
 def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     """Detect Iterator: class implementing __iter__ and __next__."""
     results: list[dict[str, Any]] = []
-    for cls in [n for n in getattr(tree, "body", []) if isinstance(n, ast.ClassDef)]:
-        methods = {m.name for m in cls.body if isinstance(m, ast.FunctionDef)}
+    for cls in top_level_classes(tree):
+        methods = method_names(cls)
         if {"__iter__", "__next__"}.issubset(methods):
             results.append(
                 {
@@ -3,6 +3,8 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import get_source_segment
+
 
 def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     """Detect Lazy Evaluation: cached_property or lru_cache or manual lazy @property."""
@@ -16,7 +18,7 @@ def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
                     for dec in m.decorator_list:
                         if isinstance(dec, ast.Name) and dec.id in {"cached_property", "property"}:
                             # simple @property considered, but increase confidence if it caches
-                            text = ast.get_source_segment(source, m) or ""
+                            text = get_source_segment(source, m) or ""
                             if "hasattr(self," in text and "setattr(self," in text:
                                 findings.append(
                                     {
@@ -3,15 +3,17 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import method_names, top_level_classes
+
 
 def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     """Detect Mediator: class with register/notify and colleagues calling it."""
     results: list[dict[str, Any]] = []
 
     mediators: set[str] = set()
-    for cls in [n for n in getattr(tree, "body", []) if isinstance(n, ast.ClassDef)]:
-        method_names = {m.name for m in cls.body if isinstance(m, ast.FunctionDef)}
-        if {"register", "notify"}.issubset(method_names):
+    for cls in top_level_classes(tree):
+        methods = method_names(cls)
+        if {"register", "notify"}.issubset(methods):
             mediators.add(cls.name)
 
     if not mediators:
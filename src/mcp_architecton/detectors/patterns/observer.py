@@ -3,17 +3,19 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import get_source_segment, method_names, top_level_classes
+
 
 def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     """Detect Observer: Subject with attach/detach/notify managing observers."""
     results: list[dict[str, Any]] = []
 
-    for cls in [n for n in getattr(tree, "body", []) if isinstance(n, ast.ClassDef)]:
-        method_names = {m.name for m in cls.body if isinstance(m, ast.FunctionDef)}
-        if {"attach", "detach", "notify"}.issubset(method_names):
+    for cls in top_level_classes(tree):
+        methods = method_names(cls)
+        if {"attach", "detach", "notify"}.issubset(methods):
             # also check for observers attribute usage
             src = "\n".join(
-                ast.get_source_segment(source, m) or ""
+                get_source_segment(source, m) or ""
                 for m in cls.body
                 if isinstance(m, ast.FunctionDef)
             )
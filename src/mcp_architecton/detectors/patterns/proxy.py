@@ -3,15 +3,17 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import class_methods, get_source_segment, top_level_classes
+
 
 def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     """Detect Proxy: class holding a real subject and delegating calls."""
     results: list[dict[str, Any]] = []
 
-    for cls in [n for n in getattr(tree, "body", []) if isinstance(n, ast.ClassDef)]:
+    for cls in top_level_classes(tree):
         real_attr: str | None = None
-        for m in cls.body:
-            if isinstance(m, ast.FunctionDef) and m.name == "__init__":
+        for m in class_methods(cls):
+            if m.name == "__init__":
                 for st in m.body:
                     if isinstance(st, ast.Assign):
                         for t in st.targets:
@@ -23,9 +25,9 @@ def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
                                 real_attr = t.attr
         if not real_attr:
             continue
-        for m in cls.body:
-            if isinstance(m, ast.FunctionDef) and m.name != "__init__":
-                text = ast.get_source_segment(source, m) or ""
+        for m in class_methods(cls):
+            if m.name != "__init__":
+                text = get_source_segment(source, m) or ""
                 if f"self.{real_attr}." in text:
                     results.append(
                         {
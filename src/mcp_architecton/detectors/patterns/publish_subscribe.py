@@ -3,6 +3,8 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import class_methods, get_source_segment, method_names
+
 
 def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     """Detect Publish-Subscribe pattern.
@@ -13,12 +15,12 @@ def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
 
     for node in getattr(tree, "body", []):
         if isinstance(node, ast.ClassDef):
-            names = {m.name for m in node.body if isinstance(m, ast.FunctionDef)}
+            names = method_names(node)
             if names & {"subscribe", "unsubscribe", "publish", "emit"}:
                 # check publish/emit iterates subscribers
-                for m in node.body:
-                    if isinstance(m, ast.FunctionDef) and m.name in {"publish", "emit"}:
-                        text = ast.get_source_segment(source, m) or ""
+                for m in class_methods(node):
+                    if m.name in {"publish", "emit"}:
+                        text = get_source_segment(source, m) or ""
                         if any(
                             tok in text
                             for tok in [
@@ -3,12 +3,14 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import top_level_classes
+
 
 def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     """Detect Registry: track subclasses via __init_subclass__ or class-level list."""
     findings: list[dict[str, Any]] = []
 
-    for cls in [n for n in getattr(tree, "body", []) if isinstance(n, ast.ClassDef)]:
+    for cls in top_level_classes(tree):
         has_init_subclass = any(
             isinstance(m, ast.FunctionDef) and m.name == "__init_subclass__" for m in cls.body
         )
@@ -3,11 +3,13 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import method_names, top_level_classes
+
 
 def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     """Detect Singleton: class with __new__ storing a single _instance."""
     results: list[dict[str, Any]] = []
-    for cls in [n for n in getattr(tree, "body", []) if isinstance(n, ast.ClassDef)]:
+    for cls in top_level_classes(tree):
         # Accept common aliases used for the instance holder
         instance_names = {"_instance", "_inst", "instance"}
         has_instance_attr = any(
@@ -15,7 +17,7 @@ def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
             and any(isinstance(t, ast.Name) and t.id in instance_names for t in n.targets)
             for n in cls.body
         )
-        has_new = any(isinstance(m, ast.FunctionDef) and m.name == "__new__" for m in cls.body)
+        has_new = "__new__" in method_names(cls)
         if has_instance_attr and has_new:
             results.append(
                 {
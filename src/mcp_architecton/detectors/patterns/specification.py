@@ -3,6 +3,8 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import method_names, top_level_classes
+
 
 def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     """Detect Specification pattern signals.
@@ -11,8 +13,8 @@ def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     """
     findings: list[dict[str, Any]] = []
 
-    for cls in [n for n in getattr(tree, "body", []) if isinstance(n, ast.ClassDef)]:
-        methods = {m.name for m in cls.body if isinstance(m, ast.FunctionDef)}
+    for cls in top_level_classes(tree):
+        methods = method_names(cls)
         if "is_satisfied_by" in methods and (
             methods & {"__and__", "__or__", "__invert__", "and_", "or_", "not_"}
         ):
@@ -3,21 +3,23 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import class_methods, get_source_segment, top_level_classes
+
 
 def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     """Detect State pattern: Context delegates to self.state.* methods."""
     findings: list[dict[str, Any]] = []
 
-    for cls in [n for n in getattr(tree, "body", []) if isinstance(n, ast.ClassDef)]:
+    for cls in top_level_classes(tree):
         has_state_attr = False
         delegates = False
-        for m in cls.body:
-            if isinstance(m, ast.FunctionDef) and m.name == "__init__":
-                text = ast.get_source_segment(source, m) or ""
+        for m in class_methods(cls):
+            if m.name == "__init__":
+                text = get_source_segment(source, m) or ""
                 if "self.state" in text:
                     has_state_attr = True
             if isinstance(m, ast.FunctionDef) and m.name != "__init__":
-                text = ast.get_source_segment(source, m) or ""
+                text = get_source_segment(source, m) or ""
                 if "self.state." in text:
                     delegates = True
         if has_state_attr and delegates:
@@ -3,15 +3,17 @@ from __future__ import annotations
 import ast
 from typing import Any
 
+from mcp_architecton.analysis.ast_utils import class_methods, get_source_segment, top_level_classes
+
 
 def detect(tree: ast.AST, source: str) -> list[dict[str, Any]]:
     """Detect Visitor: element classes with accept(visitor) calling visit_*."""
     results: list[dict[str, Any]] = []
 
-    for cls in [n for n in getattr(tree, "body", []) if isinstance(n, ast.ClassDef)]:
-        for m in cls.body:
-            if isinstance(m, ast.FunctionDef) and m.name == "accept":
-                text = ast.get_source_segment(source, m) or ""
+    for cls in top_level_classes(tree):
+        for m in class_methods(cls):
+            if m.name == "accept":
+                text = get_source_segment(source, m) or ""
                 if ".visit_" in text:
                     results.append(
                         {
@@ -3,11 +3,15 @@
 Exports:
 - Generator: callable signature for generators
 - BUILTINS: combined mapping of canonical keys to generator callables
+- get_compiled: cached code object for a static scaffold
+- render_many: several scaffolds joined into one block
 """
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Mapping
+from functools import lru_cache
+from types import CodeType, MappingProxyType
 from typing import Optional
 
 try:  # pragma: no cover - optional dependency
@@ -20,14 +24,40 @@ except Exception:  # pragma: no cover
 
 from .architectures import ARCH_GENERATORS
 from .patterns import PATTERN_GENERATORS
+from .static import StaticGenerator
 
 # Public type alias
 Generator = Callable[[str, CatalogEntry | None], str | None]
 
-# Merge registries (patterns + architectures)
-BUILTINS: dict[str, Generator] = {
-    **PATTERN_GENERATORS,
-    **ARCH_GENERATORS,
-}
+# Merge registries (patterns + architectures); read-only, so callers need no defensive copy
+BUILTINS: Mapping[str, Generator] = MappingProxyType(
+    {
+        **PATTERN_GENERATORS,
+        **ARCH_GENERATORS,
+    },
+)
 
-__all__ = ["BUILTINS", "Generator"]
+
+@lru_cache(maxsize=None)
+def get_compiled(key: str) -> CodeType | None:
+    """Compile the static scaffold registered under ``key`` once and reuse the code object.
+
+    Returns None for unknown keys and for generators that render from a catalog entry.
+    """
+    gen = BUILTINS.get(key)
+    if not isinstance(gen, StaticGenerator):
+        return None
+    return compile(gen.source, f"<snippet:{key}>", "exec")
+
+
+def render_many(keys: Iterable[str], module_path: str = "") -> str:
+    """Render the scaffolds for ``keys`` into one block, separated by blank lines.
+
+    Parts are collected and joined once rather than appended with ``+=``. Unknown keys
+    raise ``KeyError``; generators that produce nothing are skipped.
+    """
+    parts = [BUILTINS[key](module_path, None) for key in keys]
+    return "\n\n".join(p for p in parts if p)
+
+
+__all__ = ["BUILTINS", "Generator", "get_compiled", "render_many"]
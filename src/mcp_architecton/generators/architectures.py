@@ -3,13 +3,13 @@ from __future__ import annotations
 from collections.abc import Callable
 
 from ..snippets.catalog import CatalogEntry  # type: ignore
+from .static import StaticGenerator
 
 Generator = Callable[[str, CatalogEntry | None], str | None]
 
 
-def gen_mvc(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_MVC_SRC = (
+    """
 class Model:
     def __init__(self): self.state = {}
 
@@ -26,12 +26,11 @@ class Controller:
         # mutate model and return rendered view
         return self.view.render(self.model)
 """
-    ).strip()
+).strip()
 
 
-def gen_hexagonal(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_HEXAGONAL_SRC = (
+    """
 class Port:
     def op(self, *args, **kwargs): ...
 
@@ -45,44 +44,40 @@ class ApplicationService:
     def __init__(self, port: Port): self.port = port
     def run(self, *args, **kwargs): return self.port.op(*args, **kwargs)
 """
-    ).strip()
+).strip()
 
 
-def gen_layered(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_LAYERED_SRC = (
+    """
 class PresentationLayer: ...
 class ApplicationLayer: ...
 class DomainLayer: ...
 class InfrastructureLayer: ...
 """
-    ).strip()
+).strip()
 
 
-def gen_clean(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_CLEAN_SRC = (
+    """
 class Entities: ...
 class UseCases: ...
 class InterfaceAdapters: ...
 class FrameworksDrivers: ...
 """
-    ).strip()
+).strip()
 
 
-def gen_three_tier(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_THREE_TIER_SRC = (
+    """
 class PresentationTier: ...
 class LogicTier: ...
 class DataTier: ...
 """
-    ).strip()
+).strip()
 
 
-def gen_repository(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_REPOSITORY_SRC = (
+    """
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
@@ -111,12 +106,11 @@ class InMemoryRepository(Repository[T]):
     def save(self, id_: str, entity: T) -> None:
         self._store[id_] = entity
 """
-    ).strip()
+).strip()
 
 
-def gen_uow(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        '''
+_UOW_SRC = (
+    '''
 class UnitOfWork:
     """Transaction boundary and resource lifetime manager."""
 
@@ -131,12 +125,11 @@ class UnitOfWork:
         # commit
         return False
 '''
-    ).strip()
+).strip()
 
 
-def gen_service_layer(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_SERVICE_LAYER_SRC = (
+    """
 class ServiceLayer:
     def __init__(self, repo, uow):
         self.repo = repo
@@ -150,14 +143,13 @@ class ServiceLayer:
             if entity is not None:
                 self.repo.save(entity)
 """
-    ).strip()
+).strip()
 
 
-def gen_message_bus(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_MESSAGE_BUS_SRC = (
+    """
 from collections import defaultdict
-from typing import Callable, Dict, list
+from typing import Callable, Dict
 
 
 class MessageBus:
@@ -171,14 +163,13 @@ class MessageBus:
         for h in self._handlers.get(topic, []):
             h(message)
 """
-    ).strip()
+).strip()
 
 
-def gen_domain_events(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_DOMAIN_EVENTS_SRC = (
+    """
 from dataclasses import dataclass
-from typing import Callable, DefaultDict, Dict, list, Type
+from typing import Callable, DefaultDict, Type
 from collections import defaultdict
 
 
@@ -197,12 +188,11 @@ class EventDispatcher:
         for h in self._subs.get(type(event), []):
             h(event)
 """
-    ).strip()
+).strip()
 
 
-def gen_cqrs(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_CQRS_SRC = (
+    """
 class Command:  # pragma: no cover - scaffold
     pass
 
@@ -220,21 +210,26 @@ class QueryHandler:
     def handle(self, qry: Query):  # pragma: no cover - scaffold
         raise NotImplementedError
 """
-    ).strip()
+).strip()
 
 
-ARCH_GENERATORS: dict[str, Generator] = {
+# Static architecture scaffolds by canonical key
+_SNIPPETS: dict[str, str] = {
     # Architecture helpers (alphabetical)
-    "cqrs": gen_cqrs,
-    "domain_events": gen_domain_events,
-    "message_bus": gen_message_bus,
-    "repository": gen_repository,
-    "service_layer": gen_service_layer,
-    "unit_of_work": gen_uow,
+    "cqrs": _CQRS_SRC,
+    "domain_events": _DOMAIN_EVENTS_SRC,
+    "message_bus": _MESSAGE_BUS_SRC,
+    "repository": _REPOSITORY_SRC,
+    "service_layer": _SERVICE_LAYER_SRC,
+    "unit_of_work": _UOW_SRC,
     # Architecture styles (alphabetical)
-    "clean": gen_clean,
-    "hexagonal": gen_hexagonal,
-    "layered": gen_layered,
-    "mvc": gen_mvc,
-    "three_tier": gen_three_tier,
+    "clean": _CLEAN_SRC,
+    "hexagonal": _HEXAGONAL_SRC,
+    "layered": _LAYERED_SRC,
+    "mvc": _MVC_SRC,
+    "three_tier": _THREE_TIER_SRC,
+}
+
+ARCH_GENERATORS: dict[str, Generator] = {
+    key: StaticGenerator(src) for key, src in _SNIPPETS.items()
 }
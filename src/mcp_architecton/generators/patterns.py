@@ -1,16 +1,17 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
 from typing import Any
 
 from ..snippets.catalog import CatalogEntry  # type: ignore
+from .static import StaticGenerator
 
 Generator = Callable[[str, Any], str | None]
 
 
-def gen_strategy(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        '''
+_STRATEGY_SRC = (
+    '''
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
@@ -50,12 +51,11 @@ class Context:
     def process(self, data: Any) -> Any:
         return self._strategy.execute(data)
 '''
-    ).strip()
+).strip()
 
 
-def gen_singleton(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_SINGLETON_SRC = (
+    """
 class Singleton:
     _instance = None
 
@@ -64,12 +64,11 @@ class Singleton:
             cls._instance = super().__new__(cls)
         return cls._instance
 """
-    ).strip()
+).strip()
 
 
-def gen_facade(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        '''
+_FACADE_SRC = (
+    '''
 class _SubsystemA:
     def op_a(self) -> str:
         return "A"
@@ -91,45 +90,43 @@ class Facade:
         # Minimal orchestration example
         return f"{self._a.op_a()}-{self._b.op_b()}"
 '''
-    ).strip()
+).strip()
 
 
-def gen_facade_function(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        '''
+_FACADE_FUNCTION_SRC = (
+    '''
 def facade_function(*args, **kwargs):  # pragma: no cover - scaffold
     """A thin facade function orchestrating multiple collaborators."""
     # TODO: call into subsystems and aggregate results
     raise NotImplementedError
 '''
-    ).strip()
+).strip()
 
 
-def gen_observer(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_OBSERVER_SRC = (
+    """
 from __future__ import annotations
 
-from typing import Callable, Dict, list
+from collections import defaultdict
+from typing import Callable
 
 
 class Observable:
     def __init__(self) -> None:
-        self._subs: Dict[str, list[Callable]] = {}
+        self._subs: defaultdict[str, list[Callable]] = defaultdict(list)
 
     def subscribe(self, event: str, handler: Callable) -> None:
-        self._subs.setdefault(event, []).append(handler)
+        self._subs[event].append(handler)
 
     def notify(self, event: str, payload) -> None:  # pragma: no cover - scaffold
         for h in self._subs.get(event, []):
             h(payload)
 """
-    ).strip()
+).strip()
 
 
-def gen_command(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_COMMAND_SRC = (
+    """
 class Command:  # pragma: no cover - scaffold
     def execute(self) -> None:
         raise NotImplementedError
@@ -146,12 +143,11 @@ class Invoker:
         for c in self._queue:
             c.execute()
 """
-    ).strip()
+).strip()
 
 
-def gen_blackboard(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_BLACKBOARD_SRC = (
+    """
 class Blackboard:
     def __init__(self) -> None:
         self._data: dict[str, object] = {}
@@ -162,12 +158,11 @@ class Blackboard:
     def get(self, key: str) -> object | None:
         return self._data.get(key)
 """
-    ).strip()
+).strip()
 
 
-def gen_borg(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        '''
+_BORG_SRC = (
+    '''
 class Borg:
     """Borg pattern: instances share state via shared __dict__."""
 
@@ -187,47 +182,59 @@ class SingletonBorg(Borg):
     def __str__(self) -> str:  # pragma: no cover - scaffold
         return str(getattr(self, "state", "default"))
 '''
-    ).strip()
+).strip()
+
+
+# Shared stand-in for a missing catalog entry, so generators allocate no empty dict
+_NO_ENTRY: Mapping[str, Any] = MappingProxyType({})
+
+
+def _refs_comment(refs: Any) -> str:
+    """Docstring tail listing catalog references, or "" when there are none."""
+    if not refs:
+        return ""
+    return "\n# References:\n" + "\n".join([f"# - {r}" for r in refs])
+
+
+# Fixed text after the rendered docstring, authored without a trailing newline so
+# the entry-driven generators need no strip()
+_CATALOG_BODY = (
+    "class Catalog:\n"
+    "    def __init__(self) -> None:\n"
+    "        self._items: dict[str, object] = {}\n\n"
+    "    def add(self, key: str, item: object) -> None:\n"
+    '        """Register an item under a key."""\n'
+    "        self._items[key] = item\n\n"
+    "    def get(self, key: str) -> object | None:\n"
+    '        """Retrieve an item by key, or None if missing."""\n'
+    "        return self._items.get(key)\n\n"
+    "    def remove(self, key: str) -> None:\n"
+    '        """Remove an item if it exists."""\n'
+    "        self._items.pop(key, None)\n\n"
+    "    def keys(self) -> list[str]:\n"
+    "        return list(self._items.keys())"
+)
 
 
 def gen_catalog(_: str, __: CatalogEntry | None) -> str | None:
-    entry = __ or {}
+    entry = __ or _NO_ENTRY
     desc = str(entry.get("intent") or entry.get("description") or "Simple in-memory catalog.")
-    refs = entry.get("refs", []) or []
-    refs_comment = ("\n# References:\n" + "\n".join(f"# - {r}" for r in refs)) if refs else ""
-    return (
-        '"""' + desc + refs_comment + '"""\n\n'
-        "class Catalog:\n"
-        "    def __init__(self) -> None:\n"
-        "        self._items: dict[str, object] = {}\n\n"
-        "    def add(self, key: str, item: object) -> None:\n"
-        '        """Register an item under a key."""\n'
-        "        self._items[key] = item\n\n"
-        "    def get(self, key: str) -> object | None:\n"
-        '        """Retrieve an item by key, or None if missing."""\n'
-        "        return self._items.get(key)\n\n"
-        "    def remove(self, key: str) -> None:\n"
-        '        """Remove an item if it exists."""\n'
-        "        self._items.pop(key, None)\n\n"
-        "    def keys(self) -> list[str]:\n"
-        "        return list(self._items.keys())\n"
-    ).strip()
-
-
-def gen_chaining_method(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+    refs_comment = _refs_comment(entry.get("refs"))
+    return f'"""{desc}{refs_comment}"""\n\n{_CATALOG_BODY}'
+
+
+_CHAINING_METHOD_SRC = (
+    """
 class Chainable:
     def step(self):
         # do work
         return self
 """
-    ).strip()
+).strip()
 
 
-def gen_delegation_pattern(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_DELEGATION_PATTERN_SRC = (
+    """
 class Real:
     def op(self) -> str: return "real"
 
@@ -236,58 +243,57 @@ class Delegator:
     def __init__(self, real: Real): self._real = real
     def op(self) -> str: return self._real.op()
 """
-    ).strip()
+).strip()
 
 
-def gen_dependency_injection(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_DEPENDENCY_INJECTION_SRC = (
+    """
 class Container:
     def __init__(self): self._deps = {}
     def register(self, key: str, dep): self._deps[key] = dep
     def resolve(self, key: str): return self._deps[key]
 """
-    ).strip()
+).strip()
+
+
+_FACTORY_BODY = (
+    "from __future__ import annotations\n"
+    "from typing import Protocol\n\n\n"
+    "class Product(Protocol):\n"
+    "    def use(self) -> str: ...\n\n\n"
+    "class Factory:  # pragma: no cover - scaffold\n"
+    "    def create(self, kind: str) -> Product:\n"
+    '        """Create a product by kind."""\n'
+    "        raise NotImplementedError\n\n\n"
+    "class ConcreteA:\n"
+    "    def use(self) -> str:\n"
+    '        return "A"\n\n\n'
+    "class ConcreteB:\n"
+    "    def use(self) -> str:\n"
+    '        return "B"\n\n\n'
+    "class SimpleFactory(Factory):\n"
+    "    def create(self, kind: str) -> Product:\n"
+    '        if kind == "A":\n'
+    "            return ConcreteA()\n"
+    '        if kind == "B":\n'
+    "            return ConcreteB()\n"
+    '        raise ValueError(f"unknown kind: {kind}")'
+)
 
 
 def gen_factory(_: str, __: CatalogEntry | None) -> str | None:
-    entry = __ or {}
+    entry = __ or _NO_ENTRY
     desc = str(
         entry.get("intent")
         or entry.get("description")
         or "Factory interface and example implementation.",
     )
-    refs = entry.get("refs", []) or []
-    refs_comment = ("\n# References:\n" + "\n".join(f"# - {r}" for r in refs)) if refs else ""
-    return (
-        '"""' + desc + refs_comment + '"""\n\n'
-        "from __future__ import annotations\n"
-        "from typing import Protocol\n\n\n"
-        "class Product(Protocol):\n"
-        "    def use(self) -> str: ...\n\n\n"
-        "class Factory:  # pragma: no cover - scaffold\n"
-        "    def create(self, kind: str) -> Product:\n"
-        '        """Create a product by kind."""\n'
-        "        raise NotImplementedError\n\n\n"
-        "class ConcreteA:\n"
-        "    def use(self) -> str:\n"
-        '        return "A"\n\n\n'
-        "class ConcreteB:\n"
-        "    def use(self) -> str:\n"
-        '        return "B"\n\n\n'
-        "class SimpleFactory(Factory):\n"
-        "    def create(self, kind: str) -> Product:\n"
-        '        if kind == "A":\n'
-        "            return ConcreteA()\n"
-        '        if kind == "B":\n'
-        "            return ConcreteB()\n"
-        '        raise ValueError(f"unknown kind: {kind}")\n'
-    ).strip()
-
-
-def gen_graph_search(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+    refs_comment = _refs_comment(entry.get("refs"))
+    return f'"""{desc}{refs_comment}"""\n\n{_FACTORY_BODY}'
+
+
+_GRAPH_SEARCH_SRC = (
+    """
 def bfs(start, neighbors):  # pragma: no cover - scaffold
     from collections import deque
     q = deque([start])
@@ -300,12 +306,11 @@ def bfs(start, neighbors):  # pragma: no cover - scaffold
                 seen.add(m)
                 q.append(m)
 """
-    ).strip()
+).strip()
 
 
-def gen_hsm(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_HSM_SRC = (
+    """
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
@@ -324,12 +329,11 @@ class HSM:
     def dispatch(self, event: str) -> None:  # pragma: no cover - scaffold
         self.state = self.state.on_event(self, event)
 """
-    ).strip()
+).strip()
 
 
-def gen_lazy_evaluation(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_LAZY_EVALUATION_SRC = (
+    """
 class Lazy:
     def __init__(self, fn): self._fn, self._val, self._done = fn, None, False
     def value(self):
@@ -337,71 +341,68 @@ class Lazy:
             self._val, self._done = self._fn(), True
         return self._val
 """
-    ).strip()
+).strip()
 
 
-def gen_memento(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_MEMENTO_SRC = (
+    """
 class Memento:
     def __init__(self, state): self.state = state
 """
-    ).strip()
+).strip()
 
 
-def gen_pool(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_POOL_SRC = (
+    """
 class Pool:
     def __init__(self): self._objs = []
     def acquire(self): return self._objs.pop() if self._objs else object()
     def release(self, obj): self._objs.append(obj)
 """
-    ).strip()
+).strip()
+
+
+_REGISTRY_BODY = (
+    "from __future__ import annotations\n"
+    "from typing import Generic, TypeVar\n\n"
+    'K = TypeVar("K")\n'
+    'V = TypeVar("V")\n\n\n'
+    "class Registry(Generic[K, V]):\n"
+    "    def __init__(self) -> None:\n"
+    "        self._reg: dict[K, V] = {}\n\n"
+    "    def register(self, key: K, val: V) -> None:\n"
+    "        self._reg[key] = val\n\n"
+    "    def get(self, key: K) -> V | None:\n"
+    "        return self._reg.get(key)\n\n"
+    "    def unregister(self, key: K) -> None:\n"
+    "        self._reg.pop(key, None)\n\n"
+    "    def keys(self) -> list[K]:\n"
+    "        return list(self._reg.keys())"
+)
 
 
 def gen_registry(_: str, __: CatalogEntry | None) -> str | None:
-    entry = __ or {}
+    entry = __ or _NO_ENTRY
     desc = str(
         entry.get("intent")
         or entry.get("description")
         or "Simple key->value registry with safe access.",
     )
-    refs = entry.get("refs", []) or []
-    refs_comment = ("\n# References:\n" + "\n".join(f"# - {r}" for r in refs)) if refs else ""
-    return (
-        '"""' + desc + refs_comment + '"""\n\n'
-        "from __future__ import annotations\n"
-        "from typing import Generic, TypeVar\n\n"
-        'K = TypeVar("K")\n'
-        'V = TypeVar("V")\n\n\n'
-        "class Registry(Generic[K, V]):\n"
-        "    def __init__(self) -> None:\n"
-        "        self._reg: dict[K, V] = {}\n\n"
-        "    def register(self, key: K, val: V) -> None:\n"
-        "        self._reg[key] = val\n\n"
-        "    def get(self, key: K) -> V | None:\n"
-        "        return self._reg.get(key)\n\n"
-        "    def unregister(self, key: K) -> None:\n"
-        "        self._reg.pop(key, None)\n\n"
-        "    def keys(self) -> list[K]:\n"
-        "        return list(self._reg.keys())\n"
-    ).strip()
-
-
-def gen_specification(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+    refs_comment = _refs_comment(entry.get("refs"))
+    return f'"""{desc}{refs_comment}"""\n\n{_REGISTRY_BODY}'
+
+
+_SPECIFICATION_SRC = (
+    """
 class Specification:
     def is_satisfied_by(self, candidate) -> bool:  # pragma: no cover - scaffold
         raise NotImplementedError
 """
-    ).strip()
+).strip()
 
 
-def gen_decorator(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_DECORATOR_SRC = (
+    """
 from typing import Protocol, runtime_checkable
 
 
@@ -422,12 +423,11 @@ class Decorator(Component):
     def op(self) -> str:
         return self._inner.op()
 """
-    ).strip()
+).strip()
 
 
-def gen_adapter(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_ADAPTER_SRC = (
+    """
 class Target:
     def request(self) -> str:  # pragma: no cover - scaffold
         return "target"
@@ -445,12 +445,11 @@ class Adapter(Target):
     def request(self) -> str:
         return self._adaptee.specific_request()
 """
-    ).strip()
+).strip()
 
 
-def gen_bridge(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_BRIDGE_SRC = (
+    """
 from abc import ABC, abstractmethod
 
 
@@ -471,23 +470,21 @@ class Abstraction:
     def op(self) -> str:
         return f"Abstraction->" + self._impl.op_impl()
 """
-    ).strip()
+).strip()
 
 
-def gen_builder(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_BUILDER_SRC = (
+    """
 class Builder:
     def reset(self) -> None: ...
     def step(self) -> None: ...
     def build(self): ...
 """
-    ).strip()
+).strip()
 
 
-def gen_composite(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_COMPOSITE_SRC = (
+    """
 from typing import Iterable
 
 
@@ -506,12 +503,11 @@ class Composite(Component):
     def op(self) -> str:
         return "+".join(c.op() for c in self.children)
 """
-    ).strip()
+).strip()
 
 
-def gen_abstract_factory(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_ABSTRACT_FACTORY_SRC = (
+    """
 from abc import ABC, abstractmethod
 
 
@@ -519,12 +515,11 @@ class AbstractFactory(ABC):
     @abstractmethod
     def create(self): ...
 """
-    ).strip()
+).strip()
 
 
-def gen_flyweight(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_FLYWEIGHT_SRC = (
+    """
 # Module-level cache for flyweight instances
 _CACHE: dict[str, object] = {}
 
@@ -537,22 +532,20 @@ def get_flyweight(key: str) -> object:  # pragma: no cover - scaffold
     _CACHE[key] = obj
     return obj
 """
-    ).strip()
+).strip()
 
 
-def gen_iterator(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_ITERATOR_SRC = (
+    """
 class IterableCollection:
     def __iter__(self):  # pragma: no cover - scaffold
         yield from []
 """
-    ).strip()
+).strip()
 
 
-def gen_mediator(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_MEDIATOR_SRC = (
+    """
 from __future__ import annotations
 
 
@@ -586,12 +579,11 @@ class ComponentB:
         # respond to A
         pass
 """
-    ).strip()
+).strip()
 
 
-def gen_factory_method(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_FACTORY_METHOD_SRC = (
+    """
 class ProductA: ...
 class ProductB: ...
 
@@ -603,12 +595,11 @@ def create_product(kind: str):  # pragma: no cover - scaffold
         return ProductB()
     raise ValueError(f"Unknown kind: {kind}")
 """
-    ).strip()
+).strip()
 
 
-def gen_prototype(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_PROTOTYPE_SRC = (
+    """
 import copy
 
 
@@ -616,12 +607,11 @@ class Prototype:
     def clone(self):
         return copy.deepcopy(self)
 """
-    ).strip()
+).strip()
 
 
-def gen_proxy(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_PROXY_SRC = (
+    """
 class Subject:
     def op(self) -> str: return "real"
 
@@ -634,12 +624,11 @@ class Proxy(Subject):
         # access control / caching cross-cutting
         return self._real.op()
 """
-    ).strip()
+).strip()
 
 
-def gen_state(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_STATE_SRC = (
+    """
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
@@ -670,12 +659,11 @@ class ConcreteStateB(State):
         # Transition example B -> A
         ctx.state = ConcreteStateA()
 """
-    ).strip()
+).strip()
 
 
-def gen_template_method(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_TEMPLATE_METHOD_SRC = (
+    """
 from abc import ABC, abstractmethod
 
 
@@ -690,23 +678,21 @@ class AbstractWorkflow(ABC):
     @abstractmethod
     def step_two(self) -> None: ...
 """
-    ).strip()
+).strip()
 
 
-def gen_chain_of_responsibility(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_CHAIN_OF_RESPONSIBILITY_SRC = (
+    """
 class Handler:
     def __init__(self, nxt=None): self._nxt = nxt
     def handle(self, req):
         if self._nxt: self._nxt.handle(req)
 """
-    ).strip()
+).strip()
 
 
-def gen_visitor(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_VISITOR_SRC = (
+    """
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
@@ -727,12 +713,11 @@ class ConcreteElement(Element):
     def accept(self, v: Visitor) -> None:
         v.visit_element(self)
 """
-    ).strip()
+).strip()
 
 
-def gen_front_controller(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_FRONT_CONTROLLER_SRC = (
+    """
 class FrontController:
     def __init__(self, dispatcher):
         self.dispatcher = dispatcher
@@ -741,12 +726,11 @@ class FrontController:
         # preprocess and dispatch
         return self.dispatcher.dispatch(request)
 """
-    ).strip()
+).strip()
 
 
-def gen_mvc(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_MVC_SRC = (
+    """
 class Model:
     def __init__(self):
         self._value = 0
@@ -773,12 +757,11 @@ class Controller:
     def show(self) -> str:
         return self.view.render(self.model.get_value())
 """
-    ).strip()
+).strip()
 
 
-def gen_publish_subscribe(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_PUBLISH_SUBSCRIBE_SRC = (
+    """
 from __future__ import annotations
 
 from typing import Callable, DefaultDict
@@ -797,60 +780,64 @@ class EventBus:
         for h in list(self._subs.get(topic, [])):
             h(payload)
 """
-    ).strip()
+).strip()
 
 
-def gen_servant(_: str, __: CatalogEntry | None) -> str | None:
-    return (
-        """
+_SERVANT_SRC = (
+    """
 class Servant:
     def serve(self, target) -> str:  # pragma: no cover - scaffold
         # provide shared functionality for various targets
         return f"served:{type(target).__name__}"
 """
-    ).strip()
-
+).strip()
+
+
+# Static pattern scaffolds by canonical key (alphabetical)
+_SNIPPETS: dict[str, str] = {
+    "abstract_factory": _ABSTRACT_FACTORY_SRC,
+    "adapter": _ADAPTER_SRC,
+    "blackboard": _BLACKBOARD_SRC,
+    "borg": _BORG_SRC,
+    "bridge": _BRIDGE_SRC,
+    "builder": _BUILDER_SRC,
+    "chain_of_responsibility": _CHAIN_OF_RESPONSIBILITY_SRC,
+    "chaining_method": _CHAINING_METHOD_SRC,
+    "command": _COMMAND_SRC,
+    "composite": _COMPOSITE_SRC,
+    "decorator": _DECORATOR_SRC,
+    "delegation_pattern": _DELEGATION_PATTERN_SRC,
+    "dependency_injection": _DEPENDENCY_INJECTION_SRC,
+    "facade": _FACADE_SRC,
+    "facade_function": _FACADE_FUNCTION_SRC,
+    "factory_method": _FACTORY_METHOD_SRC,
+    "flyweight": _FLYWEIGHT_SRC,
+    "front_controller": _FRONT_CONTROLLER_SRC,
+    "graph_search": _GRAPH_SEARCH_SRC,
+    "hsm": _HSM_SRC,
+    "iterator": _ITERATOR_SRC,
+    "lazy_evaluation": _LAZY_EVALUATION_SRC,
+    "mediator": _MEDIATOR_SRC,
+    "memento": _MEMENTO_SRC,
+    "mvc": _MVC_SRC,
+    "observer": _OBSERVER_SRC,
+    "pool": _POOL_SRC,
+    "prototype": _PROTOTYPE_SRC,
+    "proxy": _PROXY_SRC,
+    "publish_subscribe": _PUBLISH_SUBSCRIBE_SRC,
+    "servant": _SERVANT_SRC,
+    "singleton": _SINGLETON_SRC,
+    "specification": _SPECIFICATION_SRC,
+    "state": _STATE_SRC,
+    "strategy": _STRATEGY_SRC,
+    "template_method": _TEMPLATE_METHOD_SRC,
+    "visitor": _VISITOR_SRC,
+}
 
 PATTERN_GENERATORS: dict[str, Generator] = {
-    # Patterns (alphabetical)
-    "abstract_factory": gen_abstract_factory,
-    "adapter": gen_adapter,
-    "blackboard": gen_blackboard,
-    "borg": gen_borg,
-    "bridge": gen_bridge,
-    "builder": gen_builder,
+    **{key: StaticGenerator(src) for key, src in _SNIPPETS.items()},
+    # Rendered from the catalog entry
     "catalog": gen_catalog,
-    "chain_of_responsibility": gen_chain_of_responsibility,
-    "chaining_method": gen_chaining_method,
-    "command": gen_command,
-    "composite": gen_composite,
-    "decorator": gen_decorator,
-    "delegation_pattern": gen_delegation_pattern,
-    "dependency_injection": gen_dependency_injection,
-    "facade": gen_facade,
-    "facade_function": gen_facade_function,
     "factory": gen_factory,
-    "factory_method": gen_factory_method,
-    "flyweight": gen_flyweight,
-    "front_controller": gen_front_controller,
-    "mvc": gen_mvc,
-    "publish_subscribe": gen_publish_subscribe,
-    "graph_search": gen_graph_search,
-    "hsm": gen_hsm,
-    "iterator": gen_iterator,
-    "lazy_evaluation": gen_lazy_evaluation,
-    "mediator": gen_mediator,
-    "memento": gen_memento,
-    "observer": gen_observer,
-    "pool": gen_pool,
-    "prototype": gen_prototype,
-    "proxy": gen_proxy,
     "registry": gen_registry,
-    "singleton": gen_singleton,
-    "specification": gen_specification,
-    "state": gen_state,
-    "strategy": gen_strategy,
-    "template_method": gen_template_method,
-    "visitor": gen_visitor,
-    "servant": gen_servant,
 }
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import ast
-import json
+import io
 import logging
+import os
 import py_compile
+import re
+import secrets
 import tempfile
 from collections.abc import Callable
 from dataclasses import dataclass
 from difflib import unified_diff
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, cast
 
@@ -20,7 +24,9 @@ from redbaron import RedBaron
 from tree_sitter import Parser
 from tree_sitter_languages import get_language
 
+from mcp_architecton.analysis.json_utils import loads as json_loads
 from mcp_architecton.snippets.aliases import canonicalize_name  # type: ignore
+from mcp_architecton.snippets.catalog import find_catalog
 
 from .architectures import ARCH_GENERATORS
 from .patterns import PATTERN_GENERATORS
@@ -49,112 +55,154 @@ def _select_generator(name: str) -> tuple[str, str, Generator] | None:
     return None
 
 
+_JINJA_MARKERS = ("{{", "{%", "{#")
+
+
+def _is_plain(snippet: str) -> bool:
+    # Jinja would return such text unchanged: no markup, and no trailing newline or CR to
+    # normalize. Every built-in scaffold qualifies, so none pays for a template compile.
+    return (
+        not any(m in snippet for m in _JINJA_MARKERS)
+        and "\r" not in snippet
+        and not snippet.endswith("\n")
+    )
+
+
+@lru_cache(maxsize=64)
+def _compiled_template(snippet: str) -> Template:
+    return Template(snippet)
+
+
 def _render_template(snippet: str, context: dict[str, Any]) -> str:
+    if _is_plain(snippet):
+        return snippet
     try:
-        return Template(snippet).render(**context)
+        return _compiled_template(snippet).render(**context)
     except Exception:  # pragma: no cover - fallback to raw
         return snippet
 
 
+_WS_RE = re.compile(r"\s+")
+
+# A few common aliases from generator keys to catalog names
+_CATALOG_NAME_ALIASES: dict[str, str] = {
+    # architectures
+    "clean": "clean architecture",
+    "layered": "layered architecture",
+    "three tier": "3 tier",
+    "three_tier": "3 tier",
+    "mvc": "mvc",
+    "hexagonal": "hexagonal architecture",
+    "microservices": "microservices",
+    "event driven": "event driven architecture",
+    "event_driven": "event driven architecture",
+    # creational synonyms
+    "factory method": "factory method",
+}
+
+
+def _norm_catalog_name(s: str) -> str:
+    # lower, replace underscores/hyphens with spaces, collapse whitespace
+    s2 = s.lower().replace("_", " ").replace("-", " ")
+    return _WS_RE.sub(" ", s2).strip()
+
+
+@lru_cache(maxsize=1)
+def _catalog_data(path: str, mtime_ns: int) -> dict[str, Any]:
+    """Parsed catalog.json, cached until the file's mtime changes."""
+    data_loaded: Any = json_loads(Path(path).read_bytes())
+    if not isinstance(data_loaded, dict):
+        return {}
+    return cast("dict[str, Any]", data_loaded)
+
+
+@lru_cache(maxsize=1)
+def _catalog_name_index(
+    path: str, mtime_ns: int
+) -> dict[str, tuple[tuple[str, dict[str, Any]], ...]]:
+    """Catalog entries grouped by normalized name, as (lowercased category, entry) in file order."""
+    patterns_any: Any = _catalog_data(path, mtime_ns).get("patterns")
+    if not isinstance(patterns_any, list):
+        return {}
+    index: dict[str, list[tuple[str, dict[str, Any]]]] = {}
+    for it in patterns_any:
+        if not isinstance(it, dict):
+            continue
+        it_any = cast("dict[str, Any]", it)
+        it_name = str(it_any.get("name") or "").strip().lower()
+        it_cat = str(it_any.get("category") or "").strip().lower()
+        index.setdefault(_norm_catalog_name(it_name), []).append((it_cat, it_any))
+    return {key: tuple(entries) for key, entries in index.items()}
+
+
 def _load_catalog_entry(name: str, category: str) -> dict[str, Any] | None:
     """Best-effort loader for catalog.json entries.
 
     Matches by case-insensitive name; returns dict with optional refs/description.
     Works in editable installs by resolving the repo root relative to this file.
+    The catalog is parsed and indexed by name once per modification, not per lookup.
     """
     try:
-
-        def _norm(s: str) -> str:
-            # lower, replace underscores/hyphens with spaces, collapse whitespace
-            import re
-
-            s2 = s.lower().replace("_", " ").replace("-", " ")
-            return re.sub(r"\s+", " ", s2).strip()
-
-        root = Path(__file__).resolve().parents[3]
-        catalog_path = root / "data" / "patterns" / "catalog.json"
+        catalog_path = find_catalog()
         if not catalog_path.exists():
             return None
-
-        data_loaded: Any = json.loads(catalog_path.read_text())
-        if not isinstance(data_loaded, dict):
-            return None
-        data_map: dict[str, Any] = cast("dict[str, Any]", data_loaded)
-        patterns_any: Any = data_map.get("patterns")
-        if not isinstance(patterns_any, list):
-            return None
-        patterns_val: list[dict[str, Any]] = [
-            cast("dict[str, Any]", it) for it in patterns_any if isinstance(it, dict)
-        ]
+        index = _catalog_name_index(str(catalog_path), catalog_path.stat().st_mtime_ns)
 
         # Normalize name and allow a few common aliases from generator keys to catalog names
-        nl = _norm(name)
-        aliases: dict[str, str] = {
-            # architectures
-            "clean": "clean architecture",
-            "layered": "layered architecture",
-            "three tier": "3 tier",
-            "three_tier": "3 tier",
-            "mvc": "mvc",
-            "hexagonal": "hexagonal architecture",
-            "microservices": "microservices",
-            "event driven": "event driven architecture",
-            "event_driven": "event driven architecture",
-            # creational synonyms
-            "factory method": "factory method",
-        }
-        nl = aliases.get(nl, nl)
+        nl = _norm_catalog_name(name)
+        nl = _CATALOG_NAME_ALIASES.get(nl, nl)
         cat_filter = (category or "").strip().lower()
         # Don't over-constrain on generic buckets; catalog uses style-specific categories
         enforce_cat = cat_filter not in {"", "pattern", "architecture"}
 
-        for it_any in patterns_val:
-            it_name = str(it_any.get("name") or "").strip().lower()
-            it_cat = str(it_any.get("category") or "").strip().lower()
-            if _norm(it_name) == nl and (not enforce_cat or it_cat == cat_filter):
-                # Typed enough for our usage
-                return it_any
+        for it_cat, it_any in index.get(nl, ()):
+            if not enforce_cat or it_cat == cat_filter:
+                # Shallow copy keeps the cached entry safe from caller mutation
+                return dict(it_any)
         return None
     except Exception:  # pragma: no cover - non-fatal
         return None
 
 
+@lru_cache(maxsize=1)
+def _catalog_refactoring_refs(path: str, mtime_ns: int) -> tuple[str, ...]:
+    """Refactoring reference links from the catalog, deduplicated in catalog order."""
+    data = _catalog_data(path, mtime_ns)
+    refs: list[str] = []
+    # 1) General refactoring entry
+    patterns_any: Any = data.get("patterns") or []
+    patterns_list: list[dict[str, Any]] = [
+        cast("dict[str, Any]", it) for it in patterns_any if isinstance(it, dict)
+    ]
+    for it in patterns_list:
+        cat_val = str(it.get("category", ""))
+        if cat_val.strip().lower() == "refactoring":
+            refs_any: Any = it.get("refs", [])
+            refs_list: list[str] = [str(x) for x in refs_any if isinstance(x, str)]
+            for s in refs_list:
+                if s and s not in refs:
+                    refs.append(s)
+    # 2) Optional explicit techniques list if present
+    techniques_any: Any = data.get("refactorings") or []
+    techniques_list: list[dict[str, Any]] = [
+        cast("dict[str, Any]", t) for t in techniques_any if isinstance(t, dict)
+    ]
+    for tech in techniques_list:
+        url_val = str(tech.get("url", ""))
+        if url_val and url_val not in refs:
+            refs.append(url_val)
+    return tuple(refs)
+
+
 def _resolve_refactoring_refs(limit: int = 3) -> list[str]:
     """Return a prioritized list of refactoring reference links from catalog or fallback."""
     refs: list[str] = []
     try:
-        root = Path(__file__).resolve().parents[3]
-        catalog_path = root / "data" / "patterns" / "catalog.json"
+        catalog_path = find_catalog()
         if catalog_path.exists():
-            raw = catalog_path.read_text()
-            data_obj: Any = json.loads(raw)
-            data: dict[str, Any]
-            if isinstance(data_obj, dict):
-                data = cast("dict[str, Any]", data_obj)
-            else:
-                data = {}
-            # 1) General refactoring entry
-            patterns_any: Any = data.get("patterns") or []
-            patterns_list: list[dict[str, Any]] = [
-                cast("dict[str, Any]", it) for it in patterns_any if isinstance(it, dict)
-            ]
-            for it in patterns_list:
-                cat_val = str(it.get("category", ""))
-                if cat_val.strip().lower() == "refactoring":
-                    refs_any: Any = it.get("refs", [])
-                    refs_list: list[str] = [str(x) for x in refs_any if isinstance(x, str)]
-                    for s in refs_list:
-                        if s and s not in refs:
-                            refs.append(s)
-            # 2) Optional explicit techniques list if present
-            techniques_any: Any = data.get("refactorings") or []
-            techniques_list: list[dict[str, Any]] = [
-                cast("dict[str, Any]", t) for t in techniques_any if isinstance(t, dict)
-            ]
-            for tech in techniques_list:
-                url_val = str(tech.get("url", ""))
-                if url_val and url_val not in refs:
-                    refs.append(url_val)
+            refs.extend(
+                _catalog_refactoring_refs(str(catalog_path), catalog_path.stat().st_mtime_ns),
+            )
     except Exception:  # pragma: no cover - non-fatal
         pass
     # Fallbacks appended last
@@ -251,46 +299,40 @@ def _build_boilerplate_header(
     return f'"""\n{body}\n"""'
 
 
+_DEF_NODES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+
 def _top_level_defs(code: str) -> set[str]:
-    names: set[str] = set()
+    # Only the module body matters here; nested definitions are never duplicates
     try:
         tree = ast.parse(code)
-        for node in tree.body:
-            if (
-                isinstance(node, ast.FunctionDef)
-                or isinstance(node, ast.AsyncFunctionDef)
-                or isinstance(node, ast.ClassDef)
-            ):
-                names.add(node.name)
     except SyntaxError:
-        pass
-    return names
+        return set()
+    return {node.name for node in tree.body if isinstance(node, _DEF_NODES)}
+
 
+_ASTGREP_DEF_KINDS = frozenset({"function_definition", "class_definition"})
 
-def _astgrep_has_name(code: str, name: str) -> bool:
-    """Heuristic presence check using ast-grep's Python API (SgRoot).
 
-    Matches top-level function_definition or class_definition whose 'name' field equals `name`.
-    Avoids language-agnostic brace patterns and relies on node kinds/fields.
+def _astgrep_top_level_names(code: str) -> set[str]:
+    """Heuristic top-level name collection using ast-grep's Python API (SgRoot).
+
+    Parses once and collects names of function_definition/class_definition nodes whose
+    parent is the module. Relies on node kinds/fields rather than brace patterns.
+    Only the module's direct children are visited, in one pass over both kinds.
     """
+    names: set[str] = set()
     try:
         root = SgRoot(code, "python").root()
-        # Top-level functions
-        for fn in root.find_all(kind="function_definition"):
-            nm = fn.field("name")
-            parent = fn.parent()
-            if nm and nm.text() == name and parent and parent.kind() == "module":
-                return True
-        # Top-level classes
-        for cls in root.find_all(kind="class_definition"):
-            nm = cls.field("name")
-            parent = cls.parent()
-            if nm and nm.text() == name and parent and parent.kind() == "module":
-                return True
-        return False
+        for node in root.children():
+            if node.kind() in _ASTGREP_DEF_KINDS:
+                nm = node.field("name")
+                if nm:
+                    names.add(nm.text())
     except Exception:
         # Fall back gracefully if ast-grep is unavailable or parsing fails
-        return False
+        return set()
+    return names
 
 
 def _validate_parsers(code: str) -> list[str]:
@@ -377,17 +419,72 @@ class IntroduceResult:
         }
 
 
-def _write_or_diff(old: str, new: str, path: Path, dry_run: bool) -> tuple[str, bool]:
-    """Return (diff, wrote)."""
-    old_lines = old.splitlines(keepends=True)
-    new_lines = new.splitlines(keepends=True)
-    diff = "".join(
-        unified_diff(old_lines, new_lines, fromfile=str(path), tofile=str(path), lineterm=""),
-    )
+def _unified_diff_text(old_lines: list[str], new_lines: list[str], path: str) -> str:
+    """Render a unified diff straight into a buffer (no intermediate list of hunks)."""
+    buf = io.StringIO()
+    buf.writelines(unified_diff(old_lines, new_lines, fromfile=path, tofile=path, lineterm=""))
+    return buf.getvalue()
+
+
+def _create_temp_beside(path: Path) -> tuple[int, Path]:
+    """Open a new hidden file next to ``path``; returns ``(fd, tmp_path)``.
+
+    Created with mode ``0o666`` so the OS applies the umask as ``Path.write_text`` does
+    (``mkstemp`` would force ``0o600``).
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    while True:
+        tmp = path.with_name(f".{path.name}.{secrets.token_hex(4)}.tmp")
+        try:
+            return os.open(tmp, flags, 0o666), tmp
+        except FileExistsError:
+            continue
+
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    """Write ``text`` next to ``path`` and rename it into place.
+
+    Readers never observe a torn file. Like ``Path.write_text``, a symlinked target is
+    written through, an existing file keeps its permission bits and a new file gets
+    ``0o666`` less the umask.
+    """
+    path = path.resolve()
+    fd, tmp = _create_temp_beside(path)
+    try:
+        with os.fdopen(fd, "wb", buffering=1 << 20) as fh:
+            fh.write(text.encode("utf-8"))
+        try:
+            os.chmod(tmp, path.stat().st_mode & 0o7777)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _as_lines(text: str | list[str]) -> list[str]:
+    return text if isinstance(text, list) else text.splitlines(keepends=True)
+
+
+def _write_or_diff(
+    old: str | list[str],
+    new: str,
+    path: Path,
+    dry_run: bool,
+    include_diff: bool = True,
+) -> tuple[str, bool]:
+    """Return (diff, wrote); the diff is empty when ``include_diff`` is False.
+
+    ``old`` may be passed pre-split (keepends) when the caller already holds its lines.
+    """
+    diff = ""
+    if include_diff:
+        diff = _unified_diff_text(_as_lines(old), new.splitlines(keepends=True), str(path))
     wrote = False
     if not dry_run:
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(new)
+        _atomic_write_text(path, new)
         wrote = True
     return (diff, wrote)
 
@@ -398,11 +495,13 @@ def introduce_impl(
     module_path: str,
     dry_run: bool = False,
     out_path: str | None = None,
+    include_diff: bool = True,
 ) -> dict[str, Any]:
     """Generic introduce helper used by services.enforce and tools.
 
     Selects the generator by name (pattern or architecture), composes code, validates,
-    and appends or creates the module.
+    and appends or creates the module. Pass ``include_diff=False`` when only the
+    status matters (bulk dry runs) to skip rendering the unified diff.
     """
     sel = _select_generator(name)
     if not sel:
@@ -421,6 +520,33 @@ def introduce_impl(
     # Allow light templating if a generator uses placeholders
     snippet = _render_template(snippet_raw, {"name": canon, "module_path": module_path})
 
+    # Duplicate guard first: if the target already defines the snippet's top-level names,
+    # return a noop before loading refs or building the header.
+    target_path = Path(out_path or module_path)
+    exists = target_path.exists()
+    old_text = target_path.read_text() if exists else ""
+    snippet_names = _top_level_defs(snippet)
+    # Parse the target once; the names feed both the duplicate guard and the complexity hint
+    target_names = _top_level_defs(old_text)
+    duplicate = snippet_names and snippet_names.issubset(target_names)
+    if not duplicate:
+        # Fallback to ast-grep heuristic if AST set check says no-dup
+        duplicate = bool(snippet_names & _astgrep_top_level_names(old_text))
+    if duplicate:
+        return {
+            "status": "noop",
+            "category": category,
+            "name": canon,
+            "target": str(target_path),
+            "dry_run": dry_run,
+            "created": not exists,
+            "appended": False,
+            "written_to": None,
+            "diff": "",
+            "warnings": [],
+            "reason": "definitions already present",
+        }
+
     # Prepend a compact boilerplate header with integration guidance, contract, refs, tools, and complexity hint
     refs: list[str] = []
     prompt_hint: str | None = None
@@ -442,11 +568,10 @@ def introduce_impl(
             if isinstance(co_any, str) and co_any.strip():
                 contract["outputs"] = co_any.strip()
     # Simple complexity heuristic based on existing module (if any)
-    target_path = Path(out_path or module_path)
-    exists = target_path.exists()
-    old_text = target_path.read_text() if exists else ""
+    # Split once, only when a diff will be rendered; the write path needs the text alone
+    old_lines = old_text.splitlines(keepends=True) if include_diff else []
     loc_count = (old_text or snippet).count("\n") + 1
-    defs_count = len(_top_level_defs(old_text)) if old_text else len(_top_level_defs(snippet))
+    defs_count = len(target_names) if old_text else len(snippet_names)
     if loc_count >= 800 or defs_count >= 40:
         level = "high"
     elif loc_count >= 300 or defs_count >= 15:
@@ -468,35 +593,13 @@ def introduce_impl(
     )
     snippet = header + "\n\n" + snippet
 
-    # Duplicate guard: if all top-level names from snippet already exist in target, noop
-    snippet_names = _top_level_defs(snippet)
-    target_names = _top_level_defs(old_text)
-    duplicate = snippet_names and snippet_names.issubset(target_names)
-    if not duplicate:
-        # Fallback to ast-grep heuristic if AST set check says no-dup
-        duplicate = any(_astgrep_has_name(old_text, n) for n in snippet_names)
-    if duplicate:
-        return {
-            "status": "noop",
-            "category": category,
-            "name": canon,
-            "target": str(target_path),
-            "dry_run": dry_run,
-            "created": not exists,
-            "appended": False,
-            "written_to": None,
-            "diff": "",
-            "warnings": [],
-            "reason": "definitions already present",
-        }
-
     # Compose final text
     new_text = snippet if not exists else (old_text.rstrip() + "\n\n" + snippet + "\n")
 
     # Validate with multiple parsers for resilience
     warnings = _validate_parsers(new_text)
 
-    diff, wrote = _write_or_diff(old_text, new_text, target_path, dry_run)
+    diff, wrote = _write_or_diff(old_lines, new_text, target_path, dry_run, include_diff)
 
     result = IntroduceResult(
         status="ok",
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from typing import Any
+
+
+class StaticGenerator:
+    """Generator for a fixed scaffold: ignores its arguments and returns ``source``.
+
+    One slotted instance per snippet replaces a dedicated ``gen_*`` function each.
+    """
+
+    __slots__ = ("source",)
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+
+    def __call__(self, _: str, __: Any = None) -> str:
+        return self.source
+
+    def __repr__(self) -> str:
+        return f"StaticGenerator({self.source[:32]!r}...)"
+
+
+__all__ = ["StaticGenerator"]
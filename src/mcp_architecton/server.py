@@ -2,6 +2,7 @@ from __future__ import annotations
 # ruff: noqa: I001
 
 import logging
+from collections import Counter
 from pathlib import Path
 import sys
 from typing import Any, cast
@@ -370,7 +371,7 @@ def propose_architecture_impl(
     )
 
     # Aggregate Ruff counts across files from metrics
-    ruff_summary: dict[str, int] = {}
+    ruff_summary: Counter[str] = Counter()
     ruff_metrics = cast("dict[str, Any]", metrics_res.get("ruff", {}))
     results_any = ruff_metrics.get("results", [])
     if isinstance(results_any, list):
@@ -383,7 +384,7 @@ def propose_architecture_impl(
                 )
                 for code_key, cnt in counts_dict.items():
                     try:
-                        ruff_summary[str(code_key)] = ruff_summary.get(str(code_key), 0) + int(cnt)
+                        ruff_summary[str(code_key)] += int(cnt)
                     except (ValueError, TypeError):
                         # Skip non-numeric counts
                         pass
@@ -426,7 +427,7 @@ def propose_architecture_impl(
         "summary": {
             "patterns_detected": detected_patterns,
             "architectures_detected": detected_architectures,
-            "ruff_rule_counts": ruff_summary,
+            "ruff_rule_counts": dict(ruff_summary),
             "anti_indicators": anti_indicators,
         },
         "proposal": {
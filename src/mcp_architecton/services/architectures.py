@@ -1,11 +1,31 @@
 from __future__ import annotations
 
-import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, cast
 
 from mcp_architecton.analysis.ast_utils import analyze_code_for_patterns
+from mcp_architecton.analysis.json_utils import loads as json_loads
 from mcp_architecton.detectors import registry as detector_registry
+from mcp_architecton.snippets.catalog import find_catalog
+
+_ARCHITECTURE = "architecture"
+
+
+@lru_cache(maxsize=1)
+def _load_architectures(path: str, mtime_ns: int) -> tuple[dict[str, Any], ...]:
+    """Parse the catalog and keep architecture entries; cached per file version."""
+    data = json_loads(Path(path).read_bytes())
+    items = data.get("patterns") if isinstance(data, dict) else None
+    if not isinstance(items, list):
+        return ()
+    return tuple(
+        it
+        for it in cast("list[Any]", items)
+        if isinstance(it, dict)
+        and isinstance(cat := it.get("category"), str)
+        and cat.lower() == _ARCHITECTURE
+    )
 
 
 def list_architectures_impl() -> list[dict[str, Any]]:
@@ -13,21 +33,13 @@ def list_architectures_impl() -> list[dict[str, Any]]:
 
     Returns empty list on any error.
     """
-    catalog_path = Path(__file__).resolve().parents[3] / "data" / "patterns" / "catalog.json"
+    catalog_path = find_catalog()
     try:
         if not catalog_path.exists():
             return []
-        data = json.loads(catalog_path.read_text())
-        items = (
-            cast("list[dict[str, Any]]", data.get("patterns", [])) if isinstance(data, dict) else []
-        )
-        out: list[dict[str, Any]] = []
-        for it in items:
-            if not isinstance(it, dict):
-                continue
-            if str(it.get("category", "")).lower() == "architecture":
-                out.append(it)
-        return out
+        cached = _load_architectures(str(catalog_path), catalog_path.stat().st_mtime_ns)
+        # Shallow copies keep the cached entries safe from caller mutation
+        return [dict(it) for it in cached]
     except Exception:
         return []
 
@@ -1,5 +1,12 @@
 from __future__ import annotations
 
+import ast
+import mmap
+import os
+import re
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, cast
 
@@ -41,30 +48,218 @@ def _iter_py_files(paths: list[str]) -> list[Path]:
     return uniq
 
 
+# Lowercase literals that a file must contain (any of) for the detector of the
+# keyed canonical target to fire. Files without any hint are skipped before
+# parsing; targets without an entry always get the full detector pass.
+PATTERN_LITERAL_HINTS: dict[str, tuple[bytes, ...]] = {
+    # Architectures
+    "repository": (b"repo",),
+    "unit_of_work": (b"uow", b"unitofwork"),
+    "message_bus": (b"messagebus", b"message_bus", b"bus =", b"handlers = {", b"handler_map"),
+    "domain_events": (b"event",),
+    "cqrs": (b"command",),
+    "service_layer": (b"service", b"usecase", b"use_case", b"uow"),
+    "front_controller": (b"handle", b"dispatch", b"route", b"process_request"),
+    "mvc": (b"controller", b"presenter"),
+    "three_tier": (b"service",),
+    "layered": (b"service", b"repository", b"controller"),
+    "hexagonal": (b"adapter", b"repository", b"gateway", b"protocol", b"abc", b"abstractmethod"),
+    "clean": (
+        b"use_case",
+        b"usecase",
+        b"interactor",
+        b"entities",
+        b"adapters",
+        b"boundaries",
+        b"gateway",
+        b"entity",
+        b"value_object",
+        b"aggregate",
+    ),
+    # Patterns
+    "singleton": (b"__new__",),
+    "iterator": (b"__next__",),
+    "visitor": (b".visit_",),
+    "prototype": (b"copy.copy(", b"copy.deepcopy("),
+    "borg": (b"shared_state",),
+    "registry": (b"__init_subclass__",),
+    "observer": (b"observers",),
+    "state": (b"self.state.",),
+    "memento": (b"save", b"get_memento"),
+    "builder": (b"build",),
+}
+
+
 def _simplify(s: str) -> str:
     return "".join(ch for ch in s.lower() if ch.isalnum())
 
 
-def _files_matching_target(files: list[Path], target_name: str) -> list[Path]:
+@lru_cache(maxsize=None)
+def _detector_match_keys(name: str) -> frozenset[str]:
+    """Forms of a detector finding name accepted as a match for a target.
+
+    Direct name, simplified name, or simplified name after stripping the architecture
+    suffix. Finding names come from a small fixed registry, so this is computed once each.
+    """
+    rname = name.strip().lower()
+    base_arch = rname.replace(" architecture", "").strip()
+    return frozenset({rname, _simplify(rname), _simplify(base_arch)})
+
+
+# Files at least this large are scanned through a read-only mmap instead of a full read
+_MMAP_THRESHOLD = 64 * 1024
+
+ScanBuffer = bytes | mmap.mmap
+
+
+@contextmanager
+def _read_for_scan(path: Path) -> Iterator[ScanBuffer]:
+    """Yield a bytes-like view of ``path`` for literal scanning.
+
+    Large files are memory-mapped so rejected files are never copied or decoded;
+    small files (or platforms where mmap fails) are read in one go.
+    """
+    with path.open("rb") as fh:
+        view: mmap.mmap | None = None
+        if os.fstat(fh.fileno()).st_size >= _MMAP_THRESHOLD:
+            try:
+                view = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                view = None
+        if view is None:
+            yield fh.read()
+            return
+        with view:
+            yield view
+
+
+@lru_cache(maxsize=128)
+def _literal_regex(tokens: tuple[bytes, ...]) -> re.Pattern[bytes]:
+    # Case-insensitive search works on mmap views without a lowered copy
+    return re.compile(b"|".join(re.escape(tok) for tok in tokens), re.IGNORECASE)
+
+
+def _may_match(buf: ScanBuffer, hints: tuple[bytes, ...] | None) -> bool:
+    """Cheap literal pre-filter; True when the file could contain the target."""
+    if not hints:
+        return True
+    return _literal_regex(hints).search(buf) is not None
+
+
+# Each entry pins a full source text and module AST, so only a handful are kept
+_PARSED_CACHE_MAX = 16
+
+
+@lru_cache(maxsize=_PARSED_CACHE_MAX)
+def _parsed(path: str, mtime_ns: int) -> tuple[str, ast.Module | None]:
+    """Return ``(text, tree)`` for one version of a file; ``tree`` is None on syntax errors.
+
+    Keyed by modification time so repeated target passes over a few unchanged files reuse
+    the parse; whole-tree ranked runs share findings through ``_analyze_all`` instead.
+    """
+    text = Path(path).read_bytes().decode()
+    try:
+        tree = ast.parse(text)
+    except SyntaxError:
+        tree = None
+    return text, tree
+
+
+def _hint_scanner(targets: list[str]) -> Callable[[ScanBuffer], frozenset[bytes]]:
+    """Return a scanner reporting which hint literals of ``targets`` occur in a file.
+
+    One case-insensitive regex pass runs directly over the buffer, so mmapped files
+    are never copied.
+    """
+    tokens = sorted(
+        {tok for t in targets for tok in PATTERN_LITERAL_HINTS.get(t, ())},
+        key=lambda tok: (-len(tok), tok),
+    )
+    if not tokens:
+        return lambda buf: frozenset()
+    # Zero-width lookahead tries every offset, so overlapping literals are all seen;
+    # longest first, a literal is only shadowed where a longer one it prefixes matches
+    scanner = re.compile(
+        b"(?=(" + b"|".join(re.escape(tok) for tok in tokens) + b"))", re.IGNORECASE
+    )
+
+    def _scan(buf: ScanBuffer) -> frozenset[bytes]:
+        found: set[bytes] = set()
+        for m in scanner.finditer(buf):
+            found.add(m.group(1).lower())
+            if len(found) == len(tokens):
+                break
+        found.update(tok for tok in tokens if any(f.startswith(tok) for f in found))
+        return frozenset(found)
+
+    return _scan
+
+
+def _detect_file(f: Path) -> list[dict[str, Any]]:
+    """Detector findings for one file; empty when it cannot be read or parsed."""
+    try:
+        text, tree = _parsed(str(f), f.stat().st_mtime_ns)
+    except (OSError, UnicodeDecodeError):
+        return []
+    if tree is None:
+        # Unparseable files cannot match any detector
+        return []
+    try:
+        return analyze_code_for_patterns(text, detector_registry, tree)
+    except Exception:
+        return []
+
+
+def _analyze_all(files: list[Path], targets: list[str]) -> dict[str, list[dict[str, Any]]]:
+    """Run the detector pass once per file that could match any of ``targets``.
+
+    Files whose literals rule out every target are left out of the result.
+    """
+    target_hints = [PATTERN_LITERAL_HINTS.get(t) for t in targets]
+    # A target without hints needs every file analyzed
+    prefilter = all(target_hints)
+    scan_hints = _hint_scanner(targets)
+    prepared: dict[str, list[dict[str, Any]]] = {}
+    for f in files:
+        if prefilter:
+            try:
+                with _read_for_scan(f) as buf:
+                    seen = scan_hints(buf)
+            except OSError:
+                continue
+            if all(seen.isdisjoint(h or ()) for h in target_hints):
+                continue
+        prepared[str(f)] = _detect_file(f)
+    return prepared
+
+
+def _files_matching_target(
+    files: list[Path],
+    target_name: str,
+    prepared: dict[str, list[dict[str, Any]]] | None = None,
+) -> list[Path]:
     wanted = (target_name or "").strip().lower()
     wanted_s = _simplify(wanted)
+    hints = PATTERN_LITERAL_HINTS.get(wanted)
     hits: list[Path] = []
     for f in files:
-        try:
-            text = f.read_text()
-        except Exception:
-            continue
-        try:
-            results = analyze_code_for_patterns(text, detector_registry)
-        except Exception:
-            results = []
+        if prepared is not None:
+            # Findings computed once up front (see enforce_ranked_impl)
+            results = prepared.get(str(f))
+            if results is None:
+                continue
+        else:
+            if hints:
+                try:
+                    with _read_for_scan(f) as buf:
+                        if not _may_match(buf, hints):
+                            continue
+                except OSError:
+                    continue
+            results = _detect_file(f)
         for r in results:
-            rname = str(r.get("name", "")).strip().lower()
-            r_s = _simplify(rname)
-            # Accept direct match, simplified match, or match after stripping common suffixes
-            base_arch = rname.replace(" architecture", "").strip()
-            base_s = _simplify(base_arch)
-            if rname == wanted or r_s == wanted_s or base_s == wanted_s:
+            keys = _detector_match_keys(str(r.get("name", "")))
+            if wanted in keys or wanted_s in keys:
                 hits.append(f)
                 break
     return hits
@@ -78,12 +273,15 @@ def enforce_target_impl(
     dry_run: bool = True,
     out_dir: str | None = None,
     max_files: int | None = None,
+    include_diff: bool = True,
+    _prepared_results: dict[str, list[dict[str, Any]]] | None = None,
 ) -> dict[str, Any]:
     """Enforce a specific pattern/architecture across given paths.
 
     - Normalizes the name with aliases
     - Scopes to detector hits by default
-    - Applies introduce_impl per-file (diffs aggregated)
+    - Applies introduce_impl per-file (diffs aggregated unless ``include_diff`` is False)
+    - ``_prepared_results`` carries detector findings per file (see enforce_ranked_impl)
     """
     if not paths:
         return {"status": "error", "error": "Provide non-empty 'paths'"}
@@ -96,7 +294,11 @@ def enforce_target_impl(
     if not all_files:
         return {"status": "ok", "category": category, "changes": []}
 
-    selected = _files_matching_target(all_files, canon) if scope == "hits" else list(all_files)
+    selected = (
+        _files_matching_target(all_files, canon, _prepared_results)
+        if scope == "hits"
+        else list(all_files)
+    )
     if max_files is not None and max_files > 0:
         selected = selected[:max_files]
 
@@ -105,7 +307,13 @@ def enforce_target_impl(
         out_path_arg: str | None = None
         if out_dir:
             out_path_arg = str(Path(out_dir) / f.name)
-        res = introduce_impl(name=canon, module_path=str(f), dry_run=dry_run, out_path=out_path_arg)
+        res = introduce_impl(
+            name=canon,
+            module_path=str(f),
+            dry_run=dry_run,
+            out_path=out_path_arg,
+            include_diff=include_diff,
+        )
         if "target" not in res:
             res["target"] = str(f)
         res["category"] = category
@@ -134,8 +342,13 @@ def enforce_ranked_impl(
     scope: str = "hits",
     dry_run: bool = True,
     out_dir: str | None = None,
+    include_diff: bool = True,
 ) -> dict[str, Any]:
-    """Scan for anti-pattern indicators, rank targets, and enforce top-N."""
+    """Scan for anti-pattern indicators, rank targets, and enforce top-N.
+
+    Large dry runs can pass ``include_diff=False`` to get statuses only and re-run
+    enforce_target_impl for the targets whose diffs are actually wanted.
+    """
     if not paths:
         return {"status": "error", "error": "Provide non-empty 'paths'"}
 
@@ -159,6 +372,13 @@ def enforce_ranked_impl(
     ranked = ranked_enforcement_targets(indicators, recs, pat_map, arch_map, _impl_aliases_src)
     chosen = ranked[: top_n if top_n and top_n > 0 else 3]
 
+    # Detect once per file for all chosen targets; one literal scan per file skips
+    # the files none of them can match. In-place rewrites change the files between
+    # targets, so each target then re-detects against what is on disk
+    prepared: dict[str, list[dict[str, Any]]] | None = None
+    if scope == "hits" and chosen and (dry_run or out_dir):
+        prepared = _analyze_all(files, [_canon(t[0]) for t in chosen])
+
     applied: list[dict[str, Any]] = []
     for tgt_name, _category, weight, reasons in chosen:
         res = enforce_target_impl(
@@ -167,6 +387,8 @@ def enforce_ranked_impl(
             scope=scope,
             dry_run=dry_run,
             out_dir=out_dir,
+            include_diff=include_diff,
+            _prepared_results=prepared,
         )
         res["weight"] = weight
         res["reasons"] = reasons
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from difflib import unified_diff
+from functools import lru_cache
 
 from mcp_architecton.generators.refactor_generator import (
+    _as_lines,
+    _unified_diff_text,
     introduce_architecture_impl,
     introduce_impl,
     introduce_pattern_impl,
@@ -11,18 +13,12 @@ from mcp_architecton.generators.refactor_generator import (
 # simple helpers mirrored by tests
 
 
-def _diff(old: str, new: str, path: str) -> str:
-    return "".join(
-        unified_diff(
-            old.splitlines(keepends=True),
-            new.splitlines(keepends=True),
-            fromfile=path,
-            tofile=path,
-            lineterm="",
-        ),
-    )
+def _diff(old: str | list[str], new: str, path: str) -> str:
+    # ``old`` may already be split (keepends) by a caller that holds the original lines
+    return _unified_diff_text(_as_lines(old), new.splitlines(keepends=True), path)
 
 
+@lru_cache(maxsize=256)
 def _canonical_pattern_name(name: str | None) -> str:
     if not name:
         return ""
@@ -1,11 +1,284 @@
 from __future__ import annotations
 
+import ast
+import hashlib
 import json
+import os
 import shutil
+import stat
 import subprocess
 import tempfile
+from collections import Counter, OrderedDict, defaultdict
+from functools import lru_cache
+from importlib import metadata
 from pathlib import Path
-from typing import Any, cast
+from typing import IO, Any, cast
+
+from mcp_architecton.analysis.json_utils import loads as json_loads
+from mcp_architecton.analysis.parallel import map_texts, read_texts
+
+# Bump when the shape of cached metric records changes
+_METRICS_CACHE_VERSION = 2
+_MEMO_MAX = 512
+_memo: OrderedDict[str, dict[str, Any]] = OrderedDict()
+# path -> (mtime_ns, size, content digest), so unchanged files are not re-read; one entry
+# per path, least recently used paths dropped beyond _MEMO_MAX
+_file_digests: OrderedDict[str, tuple[int, int, str]] = OrderedDict()
+
+
+def _known_digest(key: tuple[str, int, int]) -> str | None:
+    path, mtime_ns, size = key
+    entry = _file_digests.get(path)
+    if entry is None or entry[0] != mtime_ns or entry[1] != size:
+        return None
+    _file_digests.move_to_end(path)
+    return entry[2]
+
+
+def _remember_digest(key: tuple[str, int, int], digest: str) -> None:
+    path, mtime_ns, size = key
+    _file_digests[path] = (mtime_ns, size, digest)
+    _file_digests.move_to_end(path)
+    while len(_file_digests) > _MEMO_MAX:
+        _file_digests.popitem(last=False)
+
+
+@lru_cache(maxsize=1)
+def _metrics_cache_dir() -> Path | None:
+    """Disk cache location, resolved once per process.
+
+    The disk layer is opt-in: it is used only when ``ARCHITECTON_CACHE_DIR`` names a
+    directory, so a default server never grows an unbounded cache in the user's home.
+    """
+    base = os.environ.get("ARCHITECTON_CACHE_DIR", "").strip()
+    if not base:
+        return None
+    root = Path(base)
+    try:
+        radon_version = metadata.version("radon")
+    except metadata.PackageNotFoundError:
+        radon_version = "unknown"
+    return root / "metrics" / f"radon-{radon_version}-v{_METRICS_CACHE_VERSION}"
+
+
+def _text_digest(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8", "surrogatepass"), usedforsecurity=False).hexdigest()
+
+
+def _remember(digest: str, record: dict[str, Any]) -> None:
+    _memo[digest] = record
+    _memo.move_to_end(digest)
+    while len(_memo) > _MEMO_MAX:
+        _memo.popitem(last=False)
+
+
+def _cached_metrics(digest: str) -> dict[str, Any] | None:
+    record = _memo.get(digest)
+    if record is not None:
+        _memo.move_to_end(digest)
+        return record
+    cache_dir = _metrics_cache_dir()
+    if cache_dir is None:
+        return None
+    try:
+        loaded = json_loads((cache_dir / f"{digest}.json").read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(loaded, dict):
+        return None
+    record = cast("dict[str, Any]", loaded)
+    _remember(digest, record)
+    return record
+
+
+def _store_metrics(digest: str, record: dict[str, Any]) -> None:
+    _remember(digest, record)
+    cache_dir = _metrics_cache_dir()
+    if cache_dir is None:
+        return
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = cache_dir / f"{digest}.{os.getpid()}.tmp"
+        tmp.write_text(json.dumps(record))
+        os.replace(tmp, cache_dir / f"{digest}.json")
+    except OSError:
+        pass
+
+
+# Fields of radon's raw Module result kept in metric records, in record order
+_RAW_KEYS = ("loc", "lloc", "sloc", "comments", "multi")
+
+
+@lru_cache(maxsize=1)
+def _radon_api() -> tuple[Any, Any, Any, Any]:
+    """radon entry points, imported on first use (once per worker process, not per text).
+
+    A failed import is not cached, so radon installed later is still picked up.
+    """
+    from radon.metrics import h_visit_ast, mi_compute  # type: ignore
+    from radon.raw import analyze as raw_analyze  # type: ignore
+    from radon.visitors import ComplexityVisitor  # type: ignore
+
+    return h_visit_ast, mi_compute, raw_analyze, ComplexityVisitor
+
+
+def _compute_radon_metrics(text: str, tree: ast.AST | None = None) -> dict[str, Any]:
+    """CC, MI (multi and single) and raw metrics from one parse and one raw-analysis pass.
+
+    Mirrors ``cc_visit``/``mi_visit``/``raw.analyze``; called separately those parse the
+    source three times and tokenize it three times (``mi_visit`` redoes both).
+    """
+    h_visit_ast, mi_compute, raw_analyze, ComplexityVisitor = _radon_api()  # noqa: N806
+
+    record: dict[str, Any] = {
+        "cyclomatic_complexity": None,
+        "maintainability_index": None,
+        "maintainability_index_single": None,
+        "raw": None,
+    }
+    cc_error: Exception | None = None
+    raw_error: Exception | None = None
+    mi_error: Exception | None = None
+    visitor: Any = None
+    try:
+        if tree is None:
+            tree = ast.parse(text)
+        visitor = ComplexityVisitor.from_ast(tree)
+        # radon's Function/Class blocks always carry name, complexity and lineno; they
+        # have no kind attribute, so "type" stays the empty string it has always been
+        record["cyclomatic_complexity"] = [
+            {
+                "name": obj.name,
+                "type": getattr(obj, "kind", ""),
+                "complexity": obj.complexity,
+                "lineno": obj.lineno,
+            }
+            for obj in visitor.blocks
+        ]
+    except Exception as exc:  # noqa: BLE001
+        cc_error = exc
+    raw: Any = None
+    try:
+        raw = raw_analyze(text)  # type: ignore[misc]
+        raw_fields = raw._asdict()
+        record["raw"] = {key: raw_fields[key] for key in _RAW_KEYS}
+    except Exception as exc:  # noqa: BLE001
+        raw_error = exc
+    # Same inputs as radon's mi_parameters, which parses before running the raw analysis
+    if cc_error is not None or raw_error is not None:
+        mi_error = cc_error or raw_error
+    else:
+        try:
+            volume = h_visit_ast(tree).total.volume
+            for key, count_multi in (
+                ("maintainability_index", True),
+                ("maintainability_index_single", False),
+            ):
+                comment_lines = raw.comments + (raw.multi if count_multi else 0)
+                comments = comment_lines / float(raw.sloc) * 100 if raw.sloc != 0 else 0
+                record[key] = mi_compute(volume, visitor.total_complexity, raw.lloc, comments)
+        except Exception as exc:  # noqa: BLE001
+            mi_error = exc
+    first_error = cc_error or mi_error or raw_error
+    if first_error is not None:
+        record["error"] = str(first_error)
+    return record
+
+
+def radon_metrics(
+    text: str,
+    digest: str | None = None,
+    tree: ast.AST | None = None,
+) -> dict[str, Any]:
+    """Return radon CC/MI/raw metrics for ``text``, content-addressed and cached.
+
+    Results live in an in-process LRU and, when enabled, a JSON cache on disk (see
+    ``_metrics_cache_dir``).
+    Parts that radon cannot compute are None and ``error`` holds the first failure.
+    Pass ``tree`` when the caller already parsed ``text`` so a cache miss does not reparse.
+    The returned record is shared; callers must copy before mutating.
+    """
+    digest = digest or _text_digest(text)
+    record = _cached_metrics(digest)
+    if record is None:
+        record = _compute_radon_metrics(text, tree)
+        _store_metrics(digest, record)
+    return record
+
+
+def radon_metrics_many(
+    texts: list[str],
+    digests: list[str] | None = None,
+) -> list[dict[str, Any]]:
+    """Batch form of ``radon_metrics``; cache misses are computed across worker processes."""
+    digests = digests or [_text_digest(t) for t in texts]
+    records = [_cached_metrics(d) for d in digests]
+    missing = [i for i, r in enumerate(records) if r is None]
+    computed = map_texts(_compute_radon_metrics, [texts[i] for i in missing])
+    for i, record in zip(missing, computed, strict=True):
+        _store_metrics(digests[i], record)
+        records[i] = record
+    return cast("list[dict[str, Any]]", records)
+
+
+def _file_cached_metrics(
+    path: str,
+) -> tuple[os.stat_result, tuple[str, int, int], dict[str, Any] | None]:
+    """Stat a file once: the result, its cache key and cached metrics when unchanged."""
+    st = os.stat(path)
+    key = (path, st.st_mtime_ns, st.st_size)
+    digest = _known_digest(key)
+    return st, key, _cached_metrics(digest) if digest is not None else None
+
+
+def _ruff_rule_counts(
+    ruff_exe: str,
+    args: list[str],
+    agg: defaultdict[str, Counter[str]],
+    stdin_text: str | None = None,
+) -> str | None:
+    """Run ``ruff check`` and count rule codes per file into ``agg``; returns an error or None.
+
+    With ``stdin_text`` the source is piped in and its findings are counted under "<input>".
+    """
+    # json-lines lets us aggregate while ruff is still writing, without buffering the report.
+    # stderr goes to a temp file: a second pipe read only after stdout's EOF would deadlock
+    # once ruff filled its buffer with warnings.
+    with (
+        tempfile.TemporaryFile() as err_file,
+        subprocess.Popen(
+            [ruff_exe, "check", "--output-format", "json-lines", *args],
+            stdin=subprocess.PIPE if stdin_text is not None else subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=err_file,
+        ) as proc,
+    ):
+        if stdin_text is not None:
+            # ruff reads all of stdin before it reports, so this cannot block on our reads
+            stdin = cast("IO[bytes]", proc.stdin)
+            stdin.write(stdin_text.encode())
+            stdin.close()
+        parse_error: Exception | None = None
+        for line in cast("IO[bytes]", proc.stdout):
+            if parse_error is not None or not line.strip():
+                continue
+            try:
+                item = json_loads(line)
+                fpath = str(item.get("filename", ""))
+                code_key = str(item.get("code", ""))
+            except Exception as exc:  # noqa: BLE001
+                parse_error = exc
+                continue
+            if fpath and code_key:
+                agg["<input>" if stdin_text is not None else fpath][code_key] += 1
+        returncode = proc.wait()
+        err_file.seek(0)
+        stderr = err_file.read().decode(errors="replace")
+    if returncode not in (0, 1):  # 1 indicates lint findings
+        return stderr.strip() or "ruff failed"
+    if parse_error is not None:
+        return f"ruff parse error: {parse_error}"
+    return None
 
 
 def analyze_metrics_impl(code: str | None = None, files: list[str] | None = None) -> dict[str, Any]:
@@ -15,118 +288,100 @@ def analyze_metrics_impl(code: str | None = None, files: list[str] | None = None
     Returns a dict with per-source metrics and linter analyses.
     """
     try:
-        from radon.complexity import cc_visit  # type: ignore
-        from radon.metrics import mi_visit  # type: ignore
-        from radon.raw import analyze as raw_analyze  # type: ignore
+        import radon.complexity  # type: ignore  # noqa: F401
+        import radon.metrics  # type: ignore  # noqa: F401
+        import radon.raw  # type: ignore  # noqa: F401
     except Exception as exc:  # noqa: BLE001
         return {"error": f"radon not available: {exc}"}
 
     if not code and not files:
         return {"error": "Provide 'code' or 'files'"}
 
-    texts: list[tuple[str, str]] = []
+    labels: list[str] = []
+    records: list[dict[str, Any] | None] = []
+    # (index into records, text, digest) for sources not served from the cache
+    pending: list[tuple[int, str, str]] = []
+    # (index into records, path, stat key) for files whose stat key missed the cache
+    to_read: list[tuple[int, str, tuple[str, int, int]]] = []
+    # Files ruff should lint, taken from the same stat call as the cache key
+    targets: list[str] = []
+
+    def _slot(label: str) -> int:
+        labels.append(label)
+        records.append(None)
+        return len(records) - 1
+
+    def _add_text(index: int, text: str, key: tuple[str, int, int] | None = None) -> None:
+        digest = _text_digest(text)
+        if key is not None:
+            _remember_digest(key, digest)
+        pending.append((index, text, digest))
+
     if code:
-        texts.append(("<input>", code))
+        _add_text(_slot("<input>"), code)
     if files:
         for f in files:
-            p = Path(f)
+            label = str(Path(f))
+            index = _slot(label)
             try:
-                texts.append((str(p), p.read_text()))
+                st, key, cached = _file_cached_metrics(label)
             except Exception as exc:  # noqa: BLE001
-                texts.append((str(p), f"<read-error: {exc}>"))
+                _add_text(index, f"<read-error: {exc}>")
+                continue
+            if stat.S_ISREG(st.st_mode):
+                targets.append(f)
+            if cached is not None:
+                records[index] = cached
+            else:
+                to_read.append((index, label, key))
+        texts = read_texts([p for _, p, _ in to_read])
+        for (index, _, key), text in zip(to_read, texts, strict=True):
+            if isinstance(text, Exception):
+                _add_text(index, f"<read-error: {text}>")
+            else:
+                _add_text(index, text, key)
+
+    if pending:
+        computed = radon_metrics_many([t for _, t, _ in pending], [d for _, _, d in pending])
+        for (i, _, _), record in zip(pending, computed, strict=True):
+            records[i] = record
 
     results: list[dict[str, Any]] = []
-    for label, text in texts:
-        try:
-            cc_objs: list[Any] = list(cc_visit(text))  # type: ignore[misc]
-            cc: list[dict[str, Any]] = []
-            for obj in cc_objs:
-                cc.append(
-                    {
-                        "name": getattr(obj, "name", ""),
-                        "type": getattr(obj, "kind", ""),
-                        "complexity": getattr(obj, "complexity", None),
-                        "lineno": getattr(obj, "lineno", None),
-                    },
-                )
-
-            mi: Any = mi_visit(text, multi=True)  # type: ignore[misc]
-            raw_val = raw_analyze(text)  # type: ignore[misc]
-            raw = cast("Any", raw_val)
-            results.append(
-                {
-                    "source": label,
-                    "cyclomatic_complexity": cc,
-                    "maintainability_index": mi,
-                    "raw": {
-                        "loc": getattr(raw, "loc", None),
-                        "lloc": getattr(raw, "lloc", None),
-                        "sloc": getattr(raw, "sloc", None),
-                        "comments": getattr(raw, "comments", None),
-                        "multi": getattr(raw, "multi", None),
-                    },
-                },
-            )
-        except Exception as exc:  # noqa: BLE001
-            results.append({"source": label, "error": str(exc)})
+    for label, record in zip(labels, cast("list[dict[str, Any]]", records), strict=True):
+        if "error" in record:
+            results.append({"source": label, "error": record["error"]})
+            continue
+        results.append(
+            {
+                "source": label,
+                "cyclomatic_complexity": [dict(c) for c in record["cyclomatic_complexity"]],
+                "maintainability_index": record["maintainability_index"],
+                "raw": dict(record["raw"]),
+            },
+        )
 
     # Ruff analysis (aggregated per file)
     ruff_exe = shutil.which("ruff")
     ruff_out: dict[str, Any] = {"error": "ruff CLI not available in PATH"}
     if ruff_exe:
-        tmp_dir: str | None = None
-        targets: list[str] = []
-        try:
+        if code or targets:
+            # Aggregate by file path and rule code
+            agg: defaultdict[str, Counter[str]] = defaultdict(Counter)
+            error: str | None = None
             if code:
-                tmp_dir = tempfile.mkdtemp(prefix="ruff_")
-                p = Path(tmp_dir) / "input.py"
-                p.write_text(code)
-                targets.append(str(p))
-            if files:
-                for f in files:
-                    try:
-                        if Path(f).is_file():
-                            targets.append(f)
-                    except Exception:
-                        pass
-            if targets:
-                proc = subprocess.run(
-                    [ruff_exe, "check", "--output-format", "json", *targets],
-                    check=False,
-                    capture_output=True,
-                    text=True,
-                )
-                if proc.returncode in (0, 1):  # 1 indicates lint findings
-                    try:
-                        data = json.loads(proc.stdout or "[]")
-                        # Aggregate by file path and rule code
-                        agg: dict[str, dict[str, int]] = {}
-                        items_list: list[dict[str, Any]] = (
-                            cast("list[dict[str, Any]]", data) if isinstance(data, list) else []
-                        )
-                        for item in items_list:
-                            try:
-                                fpath = str(item.get("filename", ""))
-                                code_key = str(item.get("code", ""))
-                                if fpath and code_key:
-                                    counts_for_file = agg.setdefault(fpath, {})
-                                    counts_for_file[code_key] = counts_for_file.get(code_key, 0) + 1
-                            except Exception:
-                                continue
-                        ruff_out = {
-                            "results": [
-                                {"file": fp, "counts": counts} for fp, counts in sorted(agg.items())
-                            ],
-                        }
-                    except Exception as exc:  # noqa: BLE001
-                        ruff_out = {"error": f"ruff parse error: {exc}"}
-                else:
-                    ruff_out = {"error": proc.stderr.strip() or "ruff failed"}
-        finally:
-            if tmp_dir:
-                try:
-                    shutil.rmtree(tmp_dir)
-                except Exception:
-                    pass
+                # A bare name resolves configuration from the working directory, as ruff
+                # does for files outside any project (previously a temp-directory copy)
+                stdin_args = ["--stdin-filename", "input.py", "-"]
+                error = _ruff_rule_counts(ruff_exe, stdin_args, agg, code)
+            if error is None and targets:
+                error = _ruff_rule_counts(ruff_exe, targets, agg)
+            if error is not None:
+                ruff_out = {"error": error}
+            else:
+                ruff_out = {
+                    "results": [
+                        {"file": fp, "counts": dict(counts)} for fp, counts in sorted(agg.items())
+                    ],
+                }
 
     return {"results": results, "ruff": ruff_out}
@@ -1,11 +1,39 @@
 from __future__ import annotations
 
-import json
+import hashlib
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, cast
 
 from mcp_architecton.analysis.ast_utils import analyze_code_for_patterns
+from mcp_architecton.analysis.json_utils import loads as json_loads
+from mcp_architecton.analysis.parallel import map_texts, read_texts
 from mcp_architecton.detectors import registry as detector_registry
+from mcp_architecton.snippets.catalog import find_catalog
+
+# Findings per (content digest, registry entries, analyzer); errors are never memoized
+_ANALYZE_MEMO_MAX = 256
+_RegistryKey = tuple[tuple[str, Callable[..., Any]], ...]
+_MemoKey = tuple[str, _RegistryKey, Callable[..., Any]]
+_analyze_memo: OrderedDict[_MemoKey, tuple[dict[str, Any], ...]] = OrderedDict()
+
+
+@lru_cache(maxsize=1)
+def _load_patterns(path: str, mtime_ns: int) -> tuple[dict[str, Any], ...]:
+    """Parse the catalog and keep non-architecture entries; cached per file version."""
+    data = json_loads(Path(path).read_bytes())
+    items = cast("list[dict[str, Any]]", data.get("patterns", [])) if isinstance(data, dict) else []
+    out: list[dict[str, Any]] = []
+    for it in items:
+        if not isinstance(it, dict):
+            continue
+        # Exclude Architecture category
+        if str(it.get("category", "")).lower() == "architecture":
+            continue
+        out.append(it)
+    return tuple(out)
 
 
 def list_patterns_impl() -> list[dict[str, Any]]:
@@ -14,27 +42,61 @@ def list_patterns_impl() -> list[dict[str, Any]]:
     Returns empty list on any error.
     """
     # Catalog default path relative to project root
-    catalog_path = Path(__file__).resolve().parents[3] / "data" / "patterns" / "catalog.json"
+    catalog_path = find_catalog()
     try:
         if not catalog_path.exists():
             return []
-        data = json.loads(catalog_path.read_text())
-        items = (
-            cast("list[dict[str, Any]]", data.get("patterns", [])) if isinstance(data, dict) else []
-        )
-        out: list[dict[str, Any]] = []
-        for it in items:
-            if not isinstance(it, dict):
-                continue
-            # Exclude Architecture category
-            if str(it.get("category", "")).lower() == "architecture":
-                continue
-            out.append(it)
-        return out
+        cached = _load_patterns(str(catalog_path), catalog_path.stat().st_mtime_ns)
+        # Shallow copies keep the cached entries safe from caller mutation
+        return [dict(it) for it in cached]
     except Exception:
         return []
 
 
+def _analyze_one(text: str) -> tuple[tuple[dict[str, Any], ...], str | None]:
+    """Worker: findings for one source, or the error message (runs in a pool process)."""
+    try:
+        res = analyze_code_for_patterns(text, detector_registry)
+    except Exception as exc:  # noqa: BLE001
+        return (), str(exc)
+    findings: list[dict[str, Any]] = []
+    for r in cast("list[dict[str, Any]]", res or []):
+        out = dict(r)
+        # Normalize key 'name' -> 'pattern' once here, so memo hits come out ready to label
+        if "name" in out:
+            out.setdefault("pattern", out["name"])
+        findings.append(out)
+    return tuple(findings), None
+
+
+def _memo_key(text: str, registry_key: _RegistryKey) -> _MemoKey:
+    # Keyed on the analyzer and the registry's current entries too, so swapping either or
+    # adding/removing a detector in place never serves stale findings
+    digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+    return digest, registry_key, analyze_code_for_patterns
+
+
+def _analyze_texts(texts: list[str]) -> list[tuple[tuple[dict[str, Any], ...], str | None]]:
+    """Analyze each text, serving repeats from the memo and fanning misses out to workers."""
+    registry_key: _RegistryKey = tuple(detector_registry.items())
+    keys = [_memo_key(t, registry_key) for t in texts]
+    analyzed: list[tuple[tuple[dict[str, Any], ...], str | None] | None] = []
+    for key in keys:
+        hit = _analyze_memo.get(key)
+        if hit is not None:
+            _analyze_memo.move_to_end(key)
+        analyzed.append(None if hit is None else (hit, None))
+    missing = [i for i, a in enumerate(analyzed) if a is None]
+    computed = map_texts(_analyze_one, [texts[i] for i in missing])
+    for i, (res, error) in zip(missing, computed, strict=True):
+        analyzed[i] = (res, error)
+        if error is None:
+            _analyze_memo[keys[i]] = res
+            if len(_analyze_memo) > _ANALYZE_MEMO_MAX:
+                _analyze_memo.popitem(last=False)
+    return cast("list[tuple[tuple[dict[str, Any], ...], str | None]]", analyzed)
+
+
 def analyze_patterns_impl(
     code: str | None = None,
     files: list[str] | None = None,
@@ -47,42 +109,31 @@ def analyze_patterns_impl(
     if not code and not files:
         return {"error": "Provide 'code' or 'files'"}
 
-    findings: list[dict[str, Any]] = []
-
+    # Per-source slot: either the text to analyze or a read error
+    sources: list[tuple[str, str | None, str | None]] = []
     if code is not None:
-        try:
-            res = analyze_code_for_patterns(code, detector_registry)
-        except Exception as exc:  # noqa: BLE001
-            findings.append({"source": "<input>", "error": str(exc)})
-        else:
-            for r in cast("list[dict[str, Any]]", res or []):
-                out = dict(r)
-                # Normalize key 'name' -> 'pattern' if needed
-                if "pattern" not in out and "name" in out:
-                    out["pattern"] = out.get("name")
-                out["source"] = "<input>"
-                findings.append(out)
-
+        sources.append(("<input>", code, None))
     if files:
-        for f in files:
-            p = Path(f)
-            try:
-                text = p.read_text()
-            except Exception as exc:  # noqa: BLE001
+        labels = [str(Path(f)) for f in files]
+        for label, text in zip(labels, read_texts(labels), strict=True):
+            if isinstance(text, Exception):
                 # Still return a record with source
-                findings.append({"source": str(p), "error": str(exc)})
-                continue
-            try:
-                res = analyze_code_for_patterns(text, detector_registry)
-            except Exception as exc:  # noqa: BLE001
-                findings.append({"source": str(p), "error": str(exc)})
+                sources.append((label, None, str(text)))
             else:
-                for r in cast("list[dict[str, Any]]", res or []):
-                    out = dict(r)
-                    if "pattern" not in out and "name" in out:
-                        out["pattern"] = out.get("name")
-                    out["source"] = str(p)
-                    findings.append(out)
+                sources.append((label, text, None))
+
+    analyzed = iter(_analyze_texts([t for _, t, _ in sources if t is not None]))
+    findings: list[dict[str, Any]] = []
+    for label, text, read_error in sources:
+        if text is None:
+            findings.append({"source": label, "error": read_error})
+            continue
+        res, error = next(analyzed)
+        if error is not None:
+            findings.append({"source": label, "error": error})
+            continue
+        # Memoized findings are shared between calls, so each result gets its own labelled copy
+        findings.extend({**r, "source": label} for r in res)
 
     return {"findings": findings}
 
@@ -1,37 +1,47 @@
 from __future__ import annotations
 
-import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, cast
 
+from mcp_architecton.analysis.json_utils import loads as json_loads
+from mcp_architecton.snippets.catalog import find_catalog
+
+
+@lru_cache(maxsize=1)
+def _load_refactorings(path: str, mtime_ns: int) -> tuple[dict[str, Any], ...]:
+    """Parse the catalog into refactoring entries; cached per file version."""
+    data_any = json_loads(Path(path).read_bytes())
+    if not isinstance(data_any, dict):
+        return ()
+    data: dict[str, Any] = cast("dict[str, Any]", data_any)
+    items_raw = data.get("refactorings", [])
+    items: list[dict[str, Any]] = [
+        cast("dict[str, Any]", it) for it in items_raw if isinstance(it, dict)
+    ]
+    out: list[dict[str, Any]] = []
+    for it in items:
+        name = f"{it.get('name', '')}"
+        url = f"{it.get('url', '')}"
+        hint = it.get("prompt_hint")
+        entry: dict[str, Any] = {"name": name, "url": url}
+        if isinstance(hint, str) and hint.strip():
+            entry["prompt_hint"] = hint.strip()
+        out.append(entry)
+    return tuple(out)
+
 
 def list_refactorings_impl() -> list[dict[str, Any]]:
     """List refactoring techniques from the catalog, if present.
 
     Returns empty list on any error. Each item may include name, url, and prompt_hint.
     """
-    catalog_path = Path(__file__).resolve().parents[3] / "data" / "patterns" / "catalog.json"
+    catalog_path = find_catalog()
     try:
         if not catalog_path.exists():
             return []
-        raw = json.loads(catalog_path.read_text())
-        if not isinstance(raw, dict):
-            return []
-        data: dict[str, Any] = cast("dict[str, Any]", raw)
-        items_raw = data.get("refactorings", [])
-        items: list[dict[str, Any]] = [
-            cast("dict[str, Any]", it) for it in items_raw if isinstance(it, dict)
-        ]
-        out: list[dict[str, Any]] = []
-        for it in items:
-            name = f"{it.get('name', '')}"
-            url = f"{it.get('url', '')}"
-            hint = it.get("prompt_hint")
-            entry: dict[str, Any] = {"name": name, "url": url}
-            if isinstance(hint, str) and hint.strip():
-                entry["prompt_hint"] = hint.strip()
-            out.append(entry)
-        return out
+        cached = _load_refactorings(str(catalog_path), catalog_path.stat().st_mtime_ns)
+        return [dict(it) for it in cached]
     except Exception:
         return []
 
@@ -1,14 +1,257 @@
 from __future__ import annotations
 
+import ast
+import hashlib
+import os
+import re
 import sys
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, cast
 
+from mcp_architecton.analysis.parallel import BinaryFileError, map_texts, read_texts
+from mcp_architecton.services.metrics import radon_metrics
+
 # Expose names for tests to patch even though we import inside the function
 cc_visit = None  # type: ignore[assignment]
 mi_visit = None  # type: ignore[assignment]
 raw_analyze = None  # type: ignore[assignment]
 
+_Scanned = tuple[list[dict[str, Any]], list[str], dict[str, Any]]
+
+
+def _env_int(name: str, default: int) -> int:
+    """Non-negative integer from the environment; unset or malformed values use ``default``."""
+    try:
+        return max(0, int(os.environ.get(name, "")))
+    except ValueError:
+        return default
+
+
+# Scan results per content digest, so re-scanning an unchanged tree skips the analysis
+_SCAN_CACHE_MAX = _env_int("ARCHITECTON_SCAN_CACHE_MAX", 1024)
+# Files above this size are reported as skipped instead of being read and analyzed;
+# 0 disables the limit
+_MAX_FILE_BYTES = _env_int("ARCHITECTON_MAX_FILE_BYTES", 2_000_000)
+_scan_memo: OrderedDict[str, _Scanned] = OrderedDict()
+# path -> (mtime_ns, size, content digest), so unchanged files are not even re-read;
+# one entry per path, capped like _scan_memo
+_file_digests: OrderedDict[str, tuple[int, int, str]] = OrderedDict()
+
+
+def _known_digest(key: tuple[str, int, int]) -> str | None:
+    path, mtime_ns, size = key
+    entry = _file_digests.get(path)
+    if entry is None or entry[0] != mtime_ns or entry[1] != size:
+        return None
+    _file_digests.move_to_end(path)
+    return entry[2]
+
+
+def _remember_digest(key: tuple[str, int, int], digest: str) -> None:
+    path, mtime_ns, size = key
+    _file_digests[path] = (mtime_ns, size, digest)
+    _file_digests.move_to_end(path)
+    while len(_file_digests) > _SCAN_CACHE_MAX:
+        _file_digests.popitem(last=False)
+
+
+# Recommendation texts, one shared object each
+_REC_SPLIT_LOGIC = "Strategy or Template Method to split complex logic"
+_REC_SMALLER_FUNCTIONS = "Refactor to smaller functions; apply Strategy/Facade"
+_REC_SPLIT_MODULE = "Split module by responsibility; consider Layered/MVC separation"
+_REC_REDUCE_GLOBALS = "Introduce DI/Facade; reduce global state and Any"
+_REC_AVOID_EVAL = "Avoid eval/exec; use Strategy/Factory"
+_REC_USE_LOGGING = "Use logging; keep IO at edges (Hexagonal)"
+_REC_EXTRACT_METHODS = "Extract methods (Template Method) or strategies"
+
+# Zero-width alternatives so overlapping literals (e.g. "logginglobal ") are all seen
+_HEURISTIC_RE = re.compile(
+    r"(?=(?P<glob>global )|(?P<any>from typing import Any)|(?P<eval>eval\()"
+    r"|(?P<exec>exec\()|(?P<print>print\()|(?P<log>logging))",
+)
+_HEURISTIC_GROUPS = frozenset(_HEURISTIC_RE.groupindex)
+
+
+def _heuristic_signals(text: str) -> set[str]:
+    """Names of the heuristic literals present in ``text``, found in one regex pass."""
+    found: set[str] = set()
+    for m in _HEURISTIC_RE.finditer(text):
+        found.add(cast("str", m.lastgroup))
+        if len(found) == len(_HEURISTIC_GROUPS):
+            break
+    return found
+
+
+# Every boundary str.splitlines() recognises, with \r\n counted once
+_LINE_BREAK_RE = re.compile(r"\r\n|[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+
+
+def _count_lines(text: str) -> int:
+    """``len(text.splitlines())`` without materialising the list of lines."""
+    breaks = 0
+    last_end = 0
+    for m in _LINE_BREAK_RE.finditer(text):
+        breaks += 1
+        last_end = m.end()
+    return breaks + (last_end < len(text))
+
+
+def _large_def_block_lines(text: str) -> int | None:
+    """Line count of the first blank-line-delimited block over 80 lines opening with a def.
+
+    Walks block boundaries with ``str.find`` rather than materialising ``text.split("\\n\\n")``.
+    """
+    start, n = 0, len(text)
+    while start <= n:
+        end = text.find("\n\n", start)
+        if end == -1:
+            end = n
+        # Only the final block can end in a newline, which splitlines() would not count
+        lines = 0 if end == start else text.count("\n", start, end) + 1 - (text[end - 1] == "\n")
+        if lines > 80:
+            pos = start
+            for _ in range(3):
+                nl = text.find("\n", pos, end)
+                if text[pos : nl if nl != -1 else end].strip().startswith("def "):
+                    return lines
+                if nl == -1:
+                    break
+                pos = nl + 1
+        start = end + 2
+    return None
+
+
+# Fields holding nested statements; expressions never contain a def, so nothing else is walked
+_STMT_FIELDS = frozenset({"body", "orelse", "finalbody", "handlers", "cases"})
+
+
+def _first_large_function(
+    tree: ast.AST,
+) -> tuple[ast.FunctionDef | ast.AsyncFunctionDef, int] | None:
+    """First function over 80 lines in ``ast.walk`` order, with its line count.
+
+    Walks breadth-first over statements (and except/case clauses) only. Every def sits at
+    the same depth as in the full tree, so the first hit is the one ``ast.walk`` finds.
+    """
+    queue: list[ast.AST] = [tree]
+    for node in queue:  # the queue grows while it is consumed
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            start = getattr(node, "lineno", None)
+            end = getattr(node, "end_lineno", None)
+            if isinstance(start, int) and isinstance(end, int) and end - start + 1 > 80:
+                return node, end - start + 1
+        for field in node._fields:
+            if field in _STMT_FIELDS:
+                children = getattr(node, field, None)
+                if isinstance(children, list):
+                    queue.extend(children)
+    return None
+
+
+def _indicators_for_text(text: str) -> _Scanned:
+    """Worker: indicators, recommendations and radon metrics for one source text.
+
+    The source is parsed once; the same tree feeds radon and the large-function check.
+    """
+    try:
+        tree: ast.AST | None = ast.parse(text)
+    except Exception:
+        tree = None
+    record = radon_metrics(text, tree=tree)
+
+    ind: list[dict[str, Any]] = []
+    recs: list[str] = []
+    # Cyclomatic complexity
+    # Slightly lower threshold to catch deep nesting typical in tests
+    hi_cc = [c for c in record["cyclomatic_complexity"] or [] if (c["complexity"] or 0) >= 8]
+    if hi_cc:
+        ind.append({"type": "high_cc", "count": len(hi_cc)})
+        recs.append(_REC_SPLIT_LOGIC)
+
+    # Maintainability index (single score)
+    mi_val = record.get("maintainability_index_single")
+    try:
+        if mi_val is not None and float(mi_val) < 50.0:
+            ind.append({"type": "low_mi", "mi": mi_val})
+            recs.append(_REC_SMALLER_FUNCTIONS)
+    except (TypeError, ValueError):
+        # Skip if MI value is not numeric
+        pass
+
+    # Raw metrics
+    loc = (record["raw"] or {}).get("loc")
+    if isinstance(loc, int) and loc > 1000:
+        ind.append({"type": "large_file", "loc": loc})
+        recs.append(_REC_SPLIT_MODULE)
+    # Fallback: plain line count to detect large files even if parsing fails.
+    # radon's loc already is the splitlines() count, so this only runs without it.
+    if not isinstance(loc, int):
+        total_lines = _count_lines(text)
+        if total_lines > 1000:
+            ind.append({"type": "large_file", "loc": total_lines})
+            recs.append(_REC_SPLIT_MODULE)
+
+    # Heuristic anti-signals
+    signals = _heuristic_signals(text)
+    if signals & {"glob", "any"}:
+        ind.append({"type": "global_or_any_usage"})
+        recs.append(_REC_REDUCE_GLOBALS)
+    if signals & {"eval", "exec"}:
+        ind.append({"type": "dynamic_eval"})
+        recs.append(_REC_AVOID_EVAL)
+    if "print" in signals and "log" not in signals:
+        ind.append({"type": "print_logging"})
+        recs.append(_REC_USE_LOGGING)
+
+    # Very large functions
+    detected_large_fn = False
+    # Prefer AST-based measurement when possible
+    if tree is not None:
+        large = _first_large_function(tree)
+        if large is not None:
+            node, size = large
+            ind.append({"type": "very_large_function", "lines": size, "name": node.name})
+            recs.append(_REC_EXTRACT_METHODS)
+            detected_large_fn = True
+    # Fallback: heuristic by contiguous block size starting with def
+    if not detected_large_fn:
+        block_lines = _large_def_block_lines(text)
+        if block_lines is not None:
+            ind.append({"type": "very_large_function", "lines": block_lines})
+            recs.append(_REC_EXTRACT_METHODS)
+
+    # Map duplicate recommendations once (dict keeps first-seen order)
+    return ind, list(dict.fromkeys(recs)), record
+
+
+def _digest(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+
+
+def _scan_texts(sources: list[tuple[str, str | None]]) -> list[_Scanned]:
+    """Scan (digest, text) pairs, serving cached digests and fanning the rest out to workers.
+
+    ``text`` may be None only for digests known to be cached.
+    """
+    scanned: list[_Scanned | None] = []
+    missing: list[int] = []
+    for i, (digest, _) in enumerate(sources):
+        hit = _scan_memo.get(digest)
+        if hit is not None:
+            _scan_memo.move_to_end(digest)
+        else:
+            missing.append(i)
+        scanned.append(hit)
+    # Metrics with graceful degradation (content-addressed cache, see services.metrics)
+    computed = map_texts(_indicators_for_text, [cast("str", sources[i][1]) for i in missing])
+    for i, result in zip(missing, computed, strict=True):
+        scanned[i] = result
+        _scan_memo[sources[i][0]] = result
+        while len(_scan_memo) > _SCAN_CACHE_MAX:
+            _scan_memo.popitem(last=False)
+    return cast("list[_Scanned]", scanned)
+
 
 def scan_anti_patterns_impl(
     code: str | None = None,
@@ -23,180 +266,79 @@ def scan_anti_patterns_impl(
         return {"error": "radon not available: mocked missing"}
 
     try:
-        from radon.complexity import cc_visit  # type: ignore
-        from radon.metrics import mi_visit  # type: ignore
-        from radon.raw import analyze as raw_analyze  # type: ignore
+        import radon.complexity  # type: ignore  # noqa: F401
+        import radon.metrics  # type: ignore  # noqa: F401
+        import radon.raw  # type: ignore  # noqa: F401
     except Exception as exc:  # noqa: BLE001
         return {"error": f"radon not available: {exc}"}
 
     if not code and not files:
         return {"error": "Provide 'code' or 'files'"}
 
-    texts: list[tuple[str, str]] = []
+    # (label, digest, text); text is None when the digest was served by the file-stat tier
+    sources: list[tuple[str, str, str | None]] = []
     if code:
-        texts.append(("<input>", code))
+        sources.append(("<input>", _digest(code), code))
     if files:
-        for f in files:
-            p = Path(f)
+        labels = [str(Path(f)) for f in files]
+        # (index into sources, stat key) for files that have to be read
+        to_read: list[tuple[int, tuple[str, int, int] | None]] = []
+        for label in labels:
             try:
-                texts.append((str(p), p.read_text()))
-            except (FileNotFoundError, PermissionError, OSError) as exc:
-                texts.append((str(p), f"<read-error: {exc}>"))
-
-    def _indicators_for_text(text: str) -> tuple[list[dict[str, Any]], list[str]]:
-        ind: list[dict[str, Any]] = []
-        recs: list[str] = []
-        # Cyclomatic complexity
-        try:
-            cc_objs: list[Any] = list(cc_visit(text))  # type: ignore[misc]
-            # Slightly lower threshold to catch deep nesting typical in tests
-            hi_cc = [o for o in cc_objs if getattr(o, "complexity", 0) >= 8]
-            if hi_cc:
-                ind.append({"type": "high_cc", "count": len(hi_cc)})
-                recs.append("Strategy or Template Method to split complex logic")
-        except (SyntaxError, ValueError, AttributeError):
-            # Skip complexity analysis for unparseable or invalid code
-            pass
-
-        # Maintainability index (single score)
-        try:
-            mi_val = mi_visit(text, multi=False)  # type: ignore[misc]
-            try:
-                if float(mi_val) < 50.0:
-                    ind.append({"type": "low_mi", "mi": mi_val})
-                    recs.append("Refactor to smaller functions; apply Strategy/Facade")
-            except (TypeError, ValueError):
-                # Skip if MI value is not numeric
-                pass
-        except (SyntaxError, ValueError, AttributeError):
-            # Skip MI analysis for unparseable or invalid code
-            pass
-
-        # Raw metrics
-        try:
-            raw_val = raw_analyze(text)  # type: ignore[misc]
-            raw_any = cast("Any", raw_val)
-            loc = getattr(raw_any, "loc", 0)
-            if isinstance(loc, int) and loc > 1000:
-                ind.append({"type": "large_file", "loc": loc})
-                recs.append("Split module by responsibility; consider Layered/MVC separation")
-        except (SyntaxError, ValueError, AttributeError):
-            # Skip raw analysis for unparseable or invalid code
-            pass
-        # Fallback: plain line count to detect large files even if parsing fails
-        try:
-            total_lines = len(text.splitlines())
-            if total_lines > 1000 and not any(i.get("type") == "large_file" for i in ind):
-                ind.append({"type": "large_file", "loc": total_lines})
-                recs.append("Split module by responsibility; consider Layered/MVC separation")
-        except Exception:
-            pass
-
-        # Heuristic anti-signals
-        if "global " in text or "from typing import Any" in text:
-            ind.append({"type": "global_or_any_usage"})
-            recs.append("Introduce DI/Facade; reduce global state and Any")
-        if "eval(" in text or "exec(" in text:
-            ind.append({"type": "dynamic_eval"})
-            recs.append("Avoid eval/exec; use Strategy/Factory")
-        if "print(" in text and ("logging" not in text):
-            ind.append({"type": "print_logging"})
-            recs.append("Use logging; keep IO at edges (Hexagonal)")
-
-        # Very large functions
-        detected_large_fn = False
-        # Prefer AST-based measurement when possible
-        try:
-            import ast
-
-            tree = ast.parse(text)
-            for node in ast.walk(tree):
-                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    start = getattr(node, "lineno", None)
-                    end = getattr(node, "end_lineno", None)
-                    if isinstance(start, int) and isinstance(end, int):
-                        size = end - start + 1
-                        if size > 80:
-                            ind.append(
-                                {"type": "very_large_function", "lines": size, "name": node.name},
-                            )
-                            recs.append("Extract methods (Template Method) or strategies")
-                            detected_large_fn = True
-                            break
-        except Exception:
-            # Fallback: heuristic by contiguous block size starting with def
-            pass
-        if not detected_large_fn:
-            for block in text.split("\n\n"):
-                lines = block.splitlines()
-                if len(lines) > 80 and any(line.strip().startswith("def ") for line in lines[:3]):
-                    ind.append({"type": "very_large_function", "lines": len(lines)})
-                    recs.append("Extract methods (Template Method) or strategies")
-                    break
+                st = os.stat(label)
+                key: tuple[str, int, int] | None = (label, st.st_mtime_ns, st.st_size)
+            except OSError:
+                key = None  # let the read report the error
+            else:
+                # Generated data and bundles are skipped before they are ever read
+                if 0 < _MAX_FILE_BYTES < st.st_size:
+                    text = f"<skipped-too-large: {st.st_size} bytes>"
+                    sources.append((label, _digest(text), text))
+                    continue
+            digest = _known_digest(key) if key is not None else None
+            if digest is not None and digest in _scan_memo:
+                sources.append((label, digest, None))
+                continue
+            to_read.append((len(sources), key))
+            sources.append((label, "", None))
+        read = read_texts([sources[i][0] for i, _ in to_read], skip_binary=True)
+        for (index, key), text in zip(to_read, read, strict=True):
+            if isinstance(text, OSError):
+                text = f"<read-error: {text}>"
+                key = None
+            elif isinstance(text, BinaryFileError):
+                text = "<skipped-binary>"
+            elif isinstance(text, Exception):
+                raise text
+            digest = _digest(text)
+            if key is not None:
+                _remember_digest(key, digest)
+            sources[index] = (sources[index][0], digest, text)
 
-        # Map duplicate recommendations once
-        uniq_recs: list[str] = []
-        seen_local: set[str] = set()
-        for r in recs:
-            if r not in seen_local:
-                seen_local.add(r)
-                uniq_recs.append(r)
-        return ind, uniq_recs
+    scanned = _scan_texts([(digest, text) for _, digest, text in sources])
 
     results: list[dict[str, Any]] = []
-    for label, text in texts:
-        indicators, recommendations = _indicators_for_text(text)
-        # Metrics with graceful degradation
-        cc_list: list[dict[str, Any]] = []
-        mi_val: Any = None
-        raw_val: Any = None
-        try:
-            cc_objs: list[Any] = list(cc_visit(text))  # type: ignore[misc]
-            for obj in cc_objs:
-                cc_list.append(
-                    {
-                        "name": getattr(obj, "name", ""),
-                        "type": getattr(obj, "kind", ""),
-                        "complexity": getattr(obj, "complexity", None),
-                        "lineno": getattr(obj, "lineno", None),
-                    },
-                )
-        except Exception:
-            pass
-        try:
-            mi_val = mi_visit(text, multi=True)  # type: ignore[misc]
-        except Exception:
-            pass
-        try:
-            raw_val = raw_analyze(text)  # type: ignore[misc]
-        except Exception:
-            pass
+    for (label, _, _), (indicators, recommendations, record) in zip(sources, scanned, strict=True):
+        raw_rec = record["raw"] or {}
         results.append(
             {
                 "source": label,
                 "metrics": {
-                    "cyclomatic_complexity": cc_list,
-                    "maintainability_index": mi_val,
+                    "cyclomatic_complexity": [
+                        dict(c) for c in record["cyclomatic_complexity"] or []
+                    ],
+                    "maintainability_index": record["maintainability_index"],
                     "raw": {
-                        "loc": getattr(cast("Any", raw_val), "loc", None)
-                        if raw_val is not None
-                        else None,
-                        "lloc": getattr(cast("Any", raw_val), "lloc", None)
-                        if raw_val is not None
-                        else None,
-                        "sloc": getattr(cast("Any", raw_val), "sloc", None)
-                        if raw_val is not None
-                        else None,
-                        "comments": getattr(cast("Any", raw_val), "comments", None)
-                        if raw_val is not None
-                        else None,
-                        "multi": getattr(cast("Any", raw_val), "multi", None)
-                        if raw_val is not None
-                        else None,
+                        "loc": raw_rec.get("loc"),
+                        "lloc": raw_rec.get("lloc"),
+                        "sloc": raw_rec.get("sloc"),
+                        "comments": raw_rec.get("comments"),
+                        "multi": raw_rec.get("multi"),
                     },
                 },
-                "indicators": indicators,
-                "recommendations": recommendations,
+                # Copies: the scanned tuples are shared with the cache
+                "indicators": [dict(i) for i in indicators],
+                "recommendations": list(recommendations),
             },
         )
 
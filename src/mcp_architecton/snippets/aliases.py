@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+
 # Single source of truth for alias mappings used by generators/services.
 # Keys are normalized lowercase display names; values are canonical generator keys.
 
@@ -77,32 +81,43 @@ REFACTOR_ALIASES: dict[str, str] = {
     "replace conditional with polymorphism": "replace_conditional_with_polymorphism",
 }
 
-# Backward-compatible combined map
-NAME_ALIASES: dict[str, str] = {
-    **ARCHITECTURE_ALIASES,
-    **PATTERN_ALIASES,
-    **REFACTOR_ALIASES,
-}
+# Backward-compatible combined map, read-only so the canonicalizers below can cache lookups
+NAME_ALIASES: Mapping[str, str] = MappingProxyType(
+    {
+        **ARCHITECTURE_ALIASES,
+        **PATTERN_ALIASES,
+        **REFACTOR_ALIASES,
+    },
+)
 
 
 def _norm(name: str | None) -> str:
     return (name or "").strip().lower()
 
 
+# The working set of names is bounded by the catalog, so each lookup is cached
+@lru_cache(maxsize=512)
 def canonicalize_architecture_name(name: str | None) -> str:
-    return ARCHITECTURE_ALIASES.get(_norm(name), _norm(name))
+    key = _norm(name)
+    return ARCHITECTURE_ALIASES.get(key, key)
 
 
+@lru_cache(maxsize=512)
 def canonicalize_pattern_name(name: str | None) -> str:
-    return PATTERN_ALIASES.get(_norm(name), _norm(name))
+    key = _norm(name)
+    return PATTERN_ALIASES.get(key, key)
 
 
+@lru_cache(maxsize=512)
 def canonicalize_refactor_name(name: str | None) -> str:
-    return REFACTOR_ALIASES.get(_norm(name), _norm(name))
+    key = _norm(name)
+    return REFACTOR_ALIASES.get(key, key)
 
 
+@lru_cache(maxsize=512)
 def canonicalize_name(name: str | None) -> str:
-    return NAME_ALIASES.get(_norm(name), _norm(name))
+    key = _norm(name)
+    return NAME_ALIASES.get(key, key)
 
 
 __all__ = [
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
 from typing import Any
 
 
@@ -20,4 +22,14 @@ class CatalogEntry:
     contract: dict[str, Any] | None = None
 
 
-__all__ = ["CatalogEntry"]
+@lru_cache(maxsize=1)
+def find_catalog() -> Path:
+    """Location of ``data/patterns/catalog.json`` at the repository root.
+
+    Only the path is remembered; callers check ``exists()`` on each use,
+    so a catalog created after the first lookup is still found.
+    """
+    return Path(__file__).resolve().parents[3] / "data" / "patterns" / "catalog.json"
+
+
+__all__ = ["CatalogEntry", "find_catalog"]
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 from collections.abc import Mapping
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, cast
 
+from mcp_architecton.analysis.json_utils import loads as json_loads
 
+
+@lru_cache(maxsize=1)
 def _presets_path() -> Path:
     # Resolve repo-root relative to this file
     return Path(__file__).resolve().parents[3] / "data" / "prompt_presets.json"
@@ -16,7 +19,17 @@ def _presets_path() -> Path:
 def _load() -> dict[str, list[Mapping[str, Any]]]:
     p = _presets_path()
     try:
-        raw_obj: object = json.loads(p.read_text())
+        mtime_ns = p.stat().st_mtime_ns
+    except OSError:
+        return {"prompts": [], "subruns": []}
+    return _load_cached(p, mtime_ns)
+
+
+@lru_cache(maxsize=4)
+def _load_cached(p: Path, mtime_ns: int) -> dict[str, list[Mapping[str, Any]]]:
+    # Keyed on mtime so an edited presets file is re-read; callers treat the result as read-only
+    try:
+        raw_obj: object = json_loads(p.read_bytes())
         typed_raw: dict[str, Any] = (
             cast("dict[str, Any]", raw_obj) if isinstance(raw_obj, dict) else {}
         )
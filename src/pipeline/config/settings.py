@@ -7,6 +7,11 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+try:  # optional: faster decoding of the config file
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 
 @dataclass
 class PipelineConfig:
@@ -35,8 +40,9 @@ class PipelineConfig:
             return cls()
         
         try:
-            with config_path.open() as f:
-                data = json.load(f)
+            raw = config_path.read_bytes()
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except covers both
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
             
             # Convert path strings to Path objects
             if "output_dir" in data:
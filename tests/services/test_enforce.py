@@ -0,0 +1,113 @@
+"""Tests for mcp_architecton.services.enforce target file selection."""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from mcp_architecton.services import enforce
+
+SINGLETON = """
+class Config:
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+"""
+
+
+class TestFilesMatchingTarget(unittest.TestCase):
+    """Test the literal pre-filter in front of the detector pass."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        root = Path(self._tmp.name)
+        self.hit = root / "config.py"
+        self.hit.write_text(SINGLETON)
+        self.miss = root / "plain.py"
+        self.miss.write_text("def add(a, b):\n    return a + b\n")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_files_without_hints_are_not_parsed(self):
+        """Files lacking every hint literal never reach the detectors."""
+        with patch.object(
+            enforce, "analyze_code_for_patterns", wraps=enforce.analyze_code_for_patterns
+        ) as mock_analyze:
+            hits = enforce._files_matching_target([self.hit, self.miss], "singleton")
+        self.assertEqual(hits, [self.hit])
+        self.assertEqual(mock_analyze.call_count, 1)
+
+    def test_unhinted_target_falls_back_to_full_analysis(self):
+        """Targets without registered hints analyze every file."""
+        with patch.object(enforce, "analyze_code_for_patterns", return_value=[]) as mock_analyze:
+            enforce._files_matching_target([self.hit, self.miss], "strategy")
+        self.assertEqual(mock_analyze.call_count, 2)
+
+    def test_large_files_are_scanned_via_mmap(self):
+        """Files above the mmap threshold are pre-filtered without a full read."""
+        padding = "# filler\n" * (enforce._MMAP_THRESHOLD // 9 + 1)
+        big_hit = Path(self._tmp.name) / "big_hit.py"
+        big_hit.write_text(padding + SINGLETON)
+        big_miss = Path(self._tmp.name) / "big_miss.py"
+        big_miss.write_text(padding)
+        hits = enforce._files_matching_target([big_hit, big_miss], "singleton")
+        self.assertEqual(hits, [big_hit])
+
+    def test_hint_scanner_reports_present_literals(self):
+        """One scan reports the hint literals of every requested target."""
+        scan = enforce._hint_scanner(["singleton", "iterator"])
+        self.assertEqual(scan(self.hit.read_bytes()), frozenset({b"__new__"}))
+        self.assertEqual(scan(self.miss.read_bytes()), frozenset())
+
+    def test_hint_scanner_sees_prefixes_case_and_mmapped_files(self):
+        """Literals sharing a prefix, in any case, are found in mmapped buffers too."""
+        scan = enforce._hint_scanner(["repository", "layered"])
+        self.assertEqual(scan(b"class UserRepository: ..."), frozenset({b"repo", b"repository"}))
+        padding = "# filler\n" * (enforce._MMAP_THRESHOLD // 9 + 1)
+        big = Path(self._tmp.name) / "big_repo.py"
+        big.write_text(padding + "REPO = Service()\n")
+        with enforce._read_for_scan(big) as buf:
+            self.assertIsInstance(buf, enforce.mmap.mmap)
+            self.assertEqual(scan(buf), frozenset({b"repo", b"service"}))
+
+    def test_prepared_results_are_reused(self):
+        """Ranked enforcement analyzes each candidate file once for all targets."""
+        with patch.object(
+            enforce, "analyze_code_for_patterns", wraps=enforce.analyze_code_for_patterns
+        ) as mock_analyze:
+            prepared = enforce._analyze_all([self.hit, self.miss], ["singleton", "iterator"])
+            singleton_hits = enforce._files_matching_target(
+                [self.hit, self.miss], "singleton", prepared
+            )
+            iterator_hits = enforce._files_matching_target(
+                [self.hit, self.miss], "iterator", prepared
+            )
+        self.assertEqual(list(prepared), [str(self.hit)])
+        self.assertEqual(singleton_hits, [self.hit])
+        self.assertEqual(iterator_hits, [])
+        self.assertEqual(mock_analyze.call_count, 1)
+
+    def test_in_place_ranked_runs_redetect_per_target(self):
+        """Findings are shared across targets only when the sources stay untouched."""
+        (Path(self._tmp.name) / "noisy.py").write_text(
+            "def f(x):\n    print(x)\n    return eval(x)\n"
+        )
+        paths = [self._tmp.name]
+        with (
+            patch.object(enforce, "_analyze_all", wraps=enforce._analyze_all) as mock_all,
+            patch.object(enforce, "introduce_impl", return_value={"status": "ok"}),
+        ):
+            enforce.enforce_ranked_impl(paths=paths, dry_run=True)
+            self.assertEqual(mock_all.call_count, 1)
+            enforce.enforce_ranked_impl(paths=paths, dry_run=False, out_dir=self._tmp.name)
+            self.assertEqual(mock_all.call_count, 2)
+            enforce.enforce_ranked_impl(paths=paths, dry_run=False)
+            self.assertEqual(mock_all.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
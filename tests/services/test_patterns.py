@@ -1,17 +1,39 @@
 """Tests for mcp_architecton.services.patterns module."""
 
 import json
+import os
 import tempfile
 import unittest
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from unittest.mock import patch
 
+from mcp_architecton.services import patterns
 from mcp_architecton.services.patterns import analyze_patterns_impl, list_patterns_impl
+from mcp_architecton.snippets.catalog import find_catalog
+
+
+@contextmanager
+def patch_catalog(text: str) -> Iterator[Path]:
+    """Point the patterns service at a temporary catalog file holding ``text``."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "catalog.json"
+        path.write_text(text)
+        with patch.object(patterns, "find_catalog", return_value=path):
+            yield path
 
 
 class TestListPatterns(unittest.TestCase):
     """Test the list_patterns_impl function."""
 
+    def test_find_catalog_resolves_once(self):
+        """The catalog location is probed once and shared by every catalog reader."""
+        path = find_catalog()
+        self.assertEqual(path.name, "catalog.json")
+        self.assertTrue(path.is_file())
+        self.assertIs(find_catalog(), path)
+
     def test_list_patterns_no_catalog(self):
         """Test behavior when catalog file doesn't exist."""
         with patch("pathlib.Path.exists", return_value=False):
@@ -40,32 +62,19 @@ class TestListPatterns(unittest.TestCase):
             ],
         }
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as tmp:
-            json.dump(catalog_data, tmp)
-            tmp.flush()
-
-            with (
-                patch("pathlib.Path.exists", return_value=True),
-                patch("pathlib.Path.read_text", return_value=json.dumps(catalog_data)),
-            ):
-                result = list_patterns_impl()
-
-                # Should exclude Architecture category
-                self.assertEqual(len(result), 2)
-                names = [p["name"] for p in result]
-                self.assertIn("Strategy", names)
-                self.assertIn("Singleton", names)
-                self.assertNotIn("Layered", names)
+        with patch_catalog(json.dumps(catalog_data)):
+            result = list_patterns_impl()
 
-        # Cleanup
-        Path(tmp.name).unlink(missing_ok=True)
+        # Should exclude Architecture category
+        self.assertEqual(len(result), 2)
+        names = [p["name"] for p in result]
+        self.assertIn("Strategy", names)
+        self.assertIn("Singleton", names)
+        self.assertNotIn("Layered", names)
 
     def test_list_patterns_invalid_json(self):
         """Test behavior with invalid JSON catalog."""
-        with (
-            patch("pathlib.Path.exists", return_value=True),
-            patch("pathlib.Path.read_text", return_value="invalid json"),
-        ):
+        with patch_catalog("invalid json"):
             result = list_patterns_impl()
             self.assertEqual(result, [])
 
@@ -73,10 +82,7 @@ class TestListPatterns(unittest.TestCase):
         """Test behavior when catalog doesn't have patterns key."""
         catalog_data = {"other_data": []}
 
-        with (
-            patch("pathlib.Path.exists", return_value=True),
-            patch("pathlib.Path.read_text", return_value=json.dumps(catalog_data)),
-        ):
+        with patch_catalog(json.dumps(catalog_data)):
             result = list_patterns_impl()
             self.assertEqual(result, [])
 
@@ -84,13 +90,24 @@ class TestListPatterns(unittest.TestCase):
         """Test behavior with empty catalog."""
         catalog_data = {"patterns": []}
 
-        with (
-            patch("pathlib.Path.exists", return_value=True),
-            patch("pathlib.Path.read_text", return_value=json.dumps(catalog_data)),
-        ):
+        with patch_catalog(json.dumps(catalog_data)):
             result = list_patterns_impl()
             self.assertEqual(result, [])
 
+    def test_list_patterns_reads_catalog_once_per_version(self):
+        """Unchanged catalogs are served from cache; a rewrite is picked up."""
+        entry = {"name": "Strategy", "category": "Behavioral"}
+        with patch_catalog(json.dumps({"patterns": [entry]})) as path:
+            first = list_patterns_impl()
+            with patch.object(patterns, "json_loads", wraps=patterns.json_loads) as mock_loads:
+                self.assertEqual(list_patterns_impl(), first)
+                mock_loads.assert_not_called()
+                path.write_text(json.dumps({"patterns": []}))
+                st = path.stat()
+                os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+                self.assertEqual(list_patterns_impl(), [])
+                mock_loads.assert_called_once()
+
 
 class TestAnalyzePatterns(unittest.TestCase):
     """Test the analyze_patterns_impl function."""
@@ -181,6 +198,32 @@ class ConcreteStrategy(Strategy):
 
         Path(tmp.name).unlink(missing_ok=True)
 
+    @patch("mcp_architecton.services.patterns.analyze_code_for_patterns")
+    def test_analyze_patterns_memoizes_repeated_code(self, mock_analyze):
+        """Identical code is analyzed once; later calls get fresh copies of the findings."""
+        mock_analyze.return_value = [{"name": "Facade", "confidence": 0.5}]
+
+        first = analyze_patterns_impl(code="class MemoFacade: pass")
+        first["findings"][0]["confidence"] = 0.0
+        second = analyze_patterns_impl(code="class MemoFacade: pass")
+
+        mock_analyze.assert_called_once()
+        self.assertEqual(
+            second["findings"],
+            [{"name": "Facade", "pattern": "Facade", "confidence": 0.5, "source": "<input>"}],
+        )
+
+    @patch("mcp_architecton.services.patterns.analyze_code_for_patterns")
+    def test_analyze_patterns_memo_follows_registry_changes(self, mock_analyze):
+        """Adding a detector to the registry in place invalidates memoized findings."""
+        mock_analyze.return_value = []
+        code = "class MemoRegistry: pass"
+        analyze_patterns_impl(code=code)
+        with patch.dict(patterns.detector_registry, {"Extra": lambda tree, text: []}):
+            analyze_patterns_impl(code=code)
+        analyze_patterns_impl(code=code)
+        self.assertEqual(mock_analyze.call_count, 2)
+
     def test_analyze_patterns_file_read_error(self):
         """Test handling of file read errors."""
         result = analyze_patterns_impl(files=["nonexistent_file.py"])
@@ -1,8 +1,13 @@
 """Tests for mcp_architecton.services.scan module."""
 
+import ast
+import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import patch
 
+from mcp_architecton.analysis import parallel
+from mcp_architecton.services import scan
 from mcp_architecton.services.scan import scan_anti_patterns_impl
 
 
@@ -174,6 +179,129 @@ def very_large_function():
         ]
         self.assertTrue(len(large_func_indicators) > 0, "Should detect very large function")
 
+    def test_pool_path_matches_serial_path(self):
+        """Fanning files out to worker processes yields the serial results, in order."""
+        with tempfile.TemporaryDirectory() as tmp:
+            files = []
+            for i, body in enumerate(["print('x')\n", "eval('1')\n", "def f():\n    return 1\n"]):
+                path = Path(tmp) / f"m{i}.py"
+                path.write_text(body)
+                files.append(str(path))
+            serial = scan_anti_patterns_impl(files=files)
+            with (
+                patch.object(parallel, "_WORKERS", 2),
+                patch.object(parallel, "_MIN_PARALLEL_BYTES", 0),
+            ):
+                try:
+                    pooled = scan_anti_patterns_impl(files=files)
+                finally:
+                    parallel._shutdown_pool()
+        self.assertEqual(pooled, serial)
+
+    def test_unchanged_files_are_served_from_cache(self):
+        """A second scan of an unchanged file neither re-reads nor re-analyzes it."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "cached.py"
+            path.write_text("print('cached scan')\n")
+            first = scan_anti_patterns_impl(files=[str(path)])
+            with (
+                patch.object(scan, "read_texts", wraps=scan.read_texts) as mock_read,
+                patch.object(
+                    scan, "_indicators_for_text", wraps=scan._indicators_for_text
+                ) as mock_scan,
+            ):
+                second = scan_anti_patterns_impl(files=[str(path)])
+            self.assertEqual(second, first)
+            mock_read.assert_called_once_with([], skip_binary=True)
+            mock_scan.assert_not_called()
+            # Results are copies, so mutating them leaves the cache intact
+            second["results"][0]["indicators"].clear()
+            self.assertEqual(scan_anti_patterns_impl(files=[str(path)]), first)
+
+    def test_file_digests_keep_one_bounded_entry_per_path(self):
+        """Rewriting a file replaces its digest entry, and old paths are evicted."""
+        with (
+            patch.object(scan, "_file_digests", scan.OrderedDict()),
+            patch.object(scan, "_SCAN_CACHE_MAX", 2),
+        ):
+            scan._remember_digest(("a.py", 1, 10), "d1")
+            scan._remember_digest(("a.py", 2, 10), "d2")
+            self.assertIsNone(scan._known_digest(("a.py", 1, 10)))
+            self.assertEqual(scan._known_digest(("a.py", 2, 10)), "d2")
+            scan._remember_digest(("b.py", 1, 1), "d3")
+            scan._remember_digest(("c.py", 1, 1), "d4")
+            self.assertEqual(list(scan._file_digests), ["b.py", "c.py"])
+
+    def test_env_limits_fall_back_on_malformed_values(self):
+        """Bad cache limits in the environment use the default instead of failing import."""
+        with patch.dict("os.environ", {"ARCHITECTON_SCAN_CACHE_MAX": "abc"}):
+            self.assertEqual(scan._env_int("ARCHITECTON_SCAN_CACHE_MAX", 1024), 1024)
+        with patch.dict("os.environ", {"ARCHITECTON_SCAN_CACHE_MAX": "-5"}):
+            self.assertEqual(scan._env_int("ARCHITECTON_SCAN_CACHE_MAX", 1024), 0)
+        with patch.dict("os.environ", {"ARCHITECTON_SCAN_CACHE_MAX": " 12 "}):
+            self.assertEqual(scan._env_int("ARCHITECTON_SCAN_CACHE_MAX", 1024), 12)
+        with patch.dict("os.environ", clear=True):
+            self.assertEqual(scan._env_int("ARCHITECTON_SCAN_CACHE_MAX", 1024), 1024)
+
+    def test_first_large_function_follows_walk_order(self):
+        """The statement-only walk reports the same function as a full ast.walk."""
+        big_body = "".join(f"        x{i} = {i}\n" for i in range(85))
+        source = (
+            "try:\n    pass\nexcept ValueError:\n    def handler():\n"
+            + big_body
+            + "class C:\n    def method(self):\n"
+            + big_body
+        )
+        tree = ast.parse(source)
+        expected = next(
+            n
+            for n in ast.walk(tree)
+            if isinstance(n, ast.FunctionDef) and n.end_lineno - n.lineno + 1 > 80
+        )
+        node, size = scan._first_large_function(tree)
+        self.assertIs(node, expected)
+        self.assertEqual(size, expected.end_lineno - expected.lineno + 1)
+        self.assertIsNone(scan._first_large_function(ast.parse("def f():\n    return 1\n")))
+
+    def test_oversized_and_binary_files_are_skipped(self):
+        """Large files are skipped from their stat; binary files from a NUL probe."""
+        with tempfile.TemporaryDirectory() as tmp:
+            big = Path(tmp) / "big.py"
+            big.write_text("x = 1\n" * 10)
+            blob = Path(tmp) / "blob.py"
+            blob.write_bytes(b"\x00\xff\xfe binary")
+            with (
+                patch.object(scan, "_MAX_FILE_BYTES", 20),
+                patch.object(scan, "read_texts", wraps=scan.read_texts) as mock_read,
+            ):
+                result = scan_anti_patterns_impl(files=[str(big), str(blob)])
+            mock_read.assert_called_once_with([str(blob)], skip_binary=True)
+        sources = {r["source"]: r for r in result["results"]}
+        self.assertEqual(set(sources), {str(big), str(blob)})
+
+    def test_zero_max_file_bytes_disables_the_size_limit(self):
+        """A non-positive size limit reads every file instead of skipping them all."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "sized.py"
+            path.write_text("print('x')\n" * 10)
+            with (
+                patch.object(scan, "_MAX_FILE_BYTES", 0),
+                patch.object(scan, "read_texts", wraps=scan.read_texts) as mock_read,
+            ):
+                scan_anti_patterns_impl(files=[str(path)])
+            mock_read.assert_called_once_with([str(path)], skip_binary=True)
+
+    def test_read_texts_matches_text_mode(self):
+        """Byte reads decode and translate newlines exactly like Path.read_text()."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "crlf.py"
+            path.write_bytes("x = 'é'\r\ny = 2\rz = 3\n".encode())
+            bad = Path(tmp) / "latin1.py"
+            bad.write_bytes(b"x = '\xe9'\n")
+            text, error = parallel.read_texts([path, bad])
+            self.assertEqual(text, path.read_text(encoding="utf-8"))
+            self.assertIsInstance(error, UnicodeDecodeError)
+
 
 if __name__ == "__main__":
     unittest.main()
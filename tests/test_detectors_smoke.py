@@ -3,6 +3,14 @@ from __future__ import annotations
 import ast
 from pathlib import Path
 
+from mcp_architecton.analysis import ast_utils
+from mcp_architecton.analysis.ast_utils import (
+    analysis_scope,
+    class_methods,
+    method_names,
+    top_level_classes,
+    walk_nodes,
+)
 from mcp_architecton.detectors.patterns import adapter, builder, factory
 
 SIMPLE_FACTORY = (
@@ -23,3 +31,39 @@ def test_other_detectors_no_crash() -> None:
     tree = ast.parse(sample)
     adapter.detect(tree, sample)
     builder.detect(tree, sample)
+
+
+def test_walk_nodes_matches_ast_walk() -> None:
+    sample = (
+        Path(__file__).resolve().parents[1] / "examples" / "non_pythonic_small.py"
+    ).read_text()
+    tree = ast.parse(sample)
+    for node_type in (ast.Call, ast.Assign, ast.FunctionDef):
+        expected = tuple(n for n in ast.walk(tree) if isinstance(n, node_type))
+        assert walk_nodes(tree, node_type) == expected
+
+
+def test_walk_index_is_shared_only_within_a_scope() -> None:
+    tree = ast.parse(SIMPLE_FACTORY)
+    assert walk_nodes(tree, ast.ClassDef) is not walk_nodes(tree, ast.ClassDef)
+    with analysis_scope():
+        assert walk_nodes(tree, ast.ClassDef) is walk_nodes(tree, ast.ClassDef)
+        with analysis_scope():
+            inner = walk_nodes(tree, ast.ClassDef)
+        assert walk_nodes(tree, ast.ClassDef) is inner
+    assert ast_utils._scope_memo.get() is None
+
+
+def test_class_prefix_helpers() -> None:
+    source = (
+        "class A:\n    def f(self): ...\n    async def g(self): ...\n    x = 1\n\nclass B: ...\n"
+    )
+    tree = ast.parse(source)
+    with analysis_scope():
+        classes = top_level_classes(tree)
+        assert top_level_classes(tree) is classes
+    assert top_level_classes(tree) == classes
+    assert [c.name for c in classes] == ["A", "B"]
+    assert [m.name for m in class_methods(classes[0])] == ["f"]
+    assert method_names(classes[0]) == {"f"}
+    assert method_names(classes[1]) == frozenset()
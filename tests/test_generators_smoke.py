@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from mcp_architecton.generators import BUILTINS, get_compiled, refactor_generator, render_many
+from mcp_architecton.generators.static import StaticGenerator
+
+
+def test_static_snippets_compile() -> None:
+    static = [k for k, g in BUILTINS.items() if isinstance(g, StaticGenerator)]
+    assert static
+    for key in static:
+        code = get_compiled(key)
+        assert code is not None, key
+        assert code is get_compiled(key)
+        assert code.co_filename == f"<snippet:{key}>"
+
+
+def test_get_compiled_skips_dynamic_and_unknown_keys() -> None:
+    assert get_compiled("catalog") is None
+    assert get_compiled("no_such_pattern") is None
+
+
+def test_render_many_joins_snippets_in_order() -> None:
+    keys = ["strategy", "catalog", "cqrs"]
+    expected = "\n\n".join(BUILTINS[k]("", None) for k in keys)
+    assert render_many(keys) == expected
+    assert render_many([]) == ""
+
+
+def test_render_template_skips_jinja_for_plain_snippets() -> None:
+    plain = BUILTINS["strategy"]("", None)
+    assert refactor_generator._render_template(plain, {"name": "x"}) is plain
+    rendered = refactor_generator._render_template("class {{ name }}: ...", {"name": "Foo"})
+    assert rendered == "class Foo: ..."
+
+
+def test_static_snippets_execute() -> None:
+    for key, gen in BUILTINS.items():
+        if isinstance(gen, StaticGenerator):
+            exec(get_compiled(key), {"__name__": f"snippet_{key}"})  # noqa: S102
+
+
+def test_atomic_write_matches_write_text_modes(tmp_path: Path) -> None:
+    fresh = tmp_path / "fresh.py"
+    refactor_generator._atomic_write_text(fresh, "x = 1\n")
+    reference = tmp_path / "reference.py"
+    reference.write_text("x = 1\n")
+    assert fresh.stat().st_mode & 0o777 == reference.stat().st_mode & 0o777
+
+    target = tmp_path / "target.py"
+    target.write_text("old\n")
+    target.chmod(0o640)
+    link = tmp_path / "link.py"
+    link.symlink_to(target)
+    refactor_generator._atomic_write_text(link, "new\n")
+    assert link.is_symlink()
+    assert target.read_text() == "new\n"
+    assert target.stat().st_mode & 0o777 == 0o640
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections import Counter, defaultdict
+
 from mcp_architecton.services import metrics as metrics_service
 
 SAMPLE = """\n# sample code\n\n def trivial():\n    return 42\n"""
@@ -9,3 +11,46 @@ def test_metrics_service_code() -> None:
     data = metrics_service.analyze_metrics_impl(code=SAMPLE)
     assert isinstance(data, dict)
     assert "results" in data
+
+
+def test_metrics_disk_cache_is_opt_in_and_resolved_once(monkeypatch) -> None:
+    calls: list[str] = []
+    monkeypatch.setattr(metrics_service.metadata, "version", lambda name: calls.append(name) or "1")
+    monkeypatch.delenv("ARCHITECTON_CACHE_DIR", raising=False)
+    metrics_service._metrics_cache_dir.cache_clear()
+    try:
+        assert metrics_service._metrics_cache_dir() is None
+        monkeypatch.setenv("ARCHITECTON_CACHE_DIR", "/tmp/architecton-cache")
+        metrics_service._metrics_cache_dir.cache_clear()
+        first = metrics_service._metrics_cache_dir()
+        assert first is not None and first.parts[:3] == ("/", "tmp", "architecton-cache")
+        assert metrics_service._metrics_cache_dir() is first
+        assert calls == ["radon"]
+    finally:
+        metrics_service._metrics_cache_dir.cache_clear()
+
+
+def test_file_digests_keep_one_bounded_entry_per_path(monkeypatch) -> None:
+    monkeypatch.setattr(metrics_service, "_file_digests", metrics_service.OrderedDict())
+    monkeypatch.setattr(metrics_service, "_MEMO_MAX", 2)
+    metrics_service._remember_digest(("a.py", 1, 10), "d1")
+    metrics_service._remember_digest(("a.py", 2, 10), "d2")
+    assert metrics_service._known_digest(("a.py", 1, 10)) is None
+    assert metrics_service._known_digest(("a.py", 2, 10)) == "d2"
+    metrics_service._remember_digest(("b.py", 1, 1), "d3")
+    metrics_service._remember_digest(("c.py", 1, 1), "d4")
+    assert list(metrics_service._file_digests) == ["b.py", "c.py"]
+
+
+def test_ruff_counts_survive_large_stderr(tmp_path) -> None:
+    fake_ruff = tmp_path / "ruff"
+    fake_ruff.write_text(
+        "#!/bin/sh\n"
+        "head -c 300000 /dev/zero | tr '\\0' w >&2\n"
+        'echo \'{"filename": "a.py", "code": "F401"}\'\n'
+        "exit 1\n"
+    )
+    fake_ruff.chmod(0o755)
+    agg: defaultdict[str, Counter[str]] = defaultdict(Counter)
+    assert metrics_service._ruff_rule_counts(str(fake_ruff), ["a.py"], agg) is None
+    assert agg == {"a.py": Counter({"F401": 1})}
@@ -23,3 +23,10 @@ def test_presets_cli_show_prompt():
     assert exit_code == 0
     body = buf.getvalue()
     assert "minimal seam" in body.lower()
+
+
+def test_presets_cli_reuses_parsed_file():
+    presets_cli._load_cached.cache_clear()
+    first = presets_cli._load()
+    assert presets_cli._load() is first
+    assert presets_cli._load_cached.cache_info().misses == 1
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from mcp_architecton.analysis import typehint_transformer
+from mcp_architecton.analysis.typehint_transformer import add_type_hints_to_code
+
+UNTYPED = "def add(a, b):\n    return a + b\n"
+
+
+def test_adds_any_hints_and_import() -> None:
+    changed, out = add_type_hints_to_code(UNTYPED)
+    assert changed
+    assert "from typing import Any" in out
+    assert "def add(a: Any, b: Any) -> Any:" in out
+    assert add_type_hints_to_code(out) == (False, out)
+
+
+def test_repeated_source_is_not_reparsed() -> None:
+    add_type_hints_to_code.cache_clear()
+    with patch.object(
+        typehint_transformer, "parse_module", wraps=typehint_transformer.parse_module
+    ) as mock_parse:
+        first = add_type_hints_to_code(UNTYPED)
+        second = add_type_hints_to_code(UNTYPED)
+    assert first == second
+    assert mock_parse.call_count == 1
+
+
+def test_source_without_functions_skips_parse() -> None:
+    source = "X = 1\nclass C:\n    y: int = 2\n"
+    with patch.object(typehint_transformer, "parse_module") as mock_parse:
+        assert add_type_hints_to_code(source) == (False, source)
+    mock_parse.assert_not_called()
+
+
+def test_existing_any_import_skips_import_pass() -> None:
+    source = "from typing import Any\n\n" + UNTYPED
+    with patch.object(typehint_transformer, "AddImportsVisitor") as mock_visitor:
+        changed, out = add_type_hints_to_code(source)
+    assert changed
+    assert out.count("from typing import Any") == 1
+    mock_visitor.assert_not_called()